@@ -3,12 +3,22 @@ import re
 import sys
 from abc import ABC, abstractmethod
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 
-from bs4 import BeautifulSoup as Soup
-from bs4 import Tag
+from lxml import etree
 
-from .importer.importer import File, HtmlImporter, MetsImporter
+from .importer.importer import (
+    NAMESPACES,
+    XLINK_HREF_STRING,
+    File,
+    HtmlImporter,
+    MetsImporter,
+    get_element_text,
+    get_first_xpath_result,
+    get_qualified_name,
+    get_xml_tree_from_string,
+)
 
 log_format = logging.Formatter("[%(asctime)s] [%(levelname)s] - %(message)s")
 logger = logging.getLogger("VisualLibrary")
@@ -26,13 +36,66 @@ def clean_up_string(string: str) -> str:
 
 
 def function_is_read_only():
-    Exception("This element may not be modified! Read only!")
+    raise AttributeError("This element may not be modified! Read only!")
+
+
+def lazy_metadata_property(
+    attribute_name: str, extraction_method_name: str, default=None
+):
+    """Creates a property whose value is extracted from the metadata on first access.
+    :param attribute_name: The name of the attribute holding the value.
+    :type attribute_name: str
+    :param extraction_method_name: The name of the method setting the attribute.
+    :type extraction_method_name: str
+    :param default: A factory for the value, if the extraction method does not set it.
+    :type default: callable
+    :returns: A property that runs the extraction method only once per object.
+    :rtype: property
+
+    Extraction methods may set several attributes at once (e.g. title, subtitle and prefix). Hence, every
+    extraction method is run at most once per object.
+    """
+
+    private_attribute_name = "_" + attribute_name
+
+    def extract_metadata_once(self):
+        if extraction_method_name not in self._extracted_metadata:
+            # Marked beforehand, as the extraction method assigns through the setters of these properties
+            self._extracted_metadata.add(extraction_method_name)
+            try:
+                getattr(self, extraction_method_name)()
+            except BaseException:
+                # A failed extraction is retried on the next access instead of hiding the error
+                self._extracted_metadata.discard(extraction_method_name)
+                raise
+
+    def getter(self):
+        extract_metadata_once(self)
+
+        if private_attribute_name not in vars(self):
+            setattr(
+                self,
+                private_attribute_name,
+                default() if default is not None else None,
+            )
+
+        return getattr(self, private_attribute_name)
+
+    def setter(self, value):
+        # The extraction must not overwrite a value that is set by the user later on
+        extract_metadata_once(self)
+        setattr(self, private_attribute_name, value)
+
+    return property(getter, setter)
 
 
 def get_list_by_type(container, filter_type: type):
     return [element for element in container if isinstance(element, filter_type)]
 
 
+NON_DIGIT_PATTERN = re.compile(r"\D+")
+
+
 def remove_letters_from_alphanumeric_string(string):
     """This functions removes letters from the beginning and the end of a given string.
     :param string: A string containing both letters and numbers.
@@ -47,7 +110,7 @@ def remove_letters_from_alphanumeric_string(string):
     if string is None:
         return None
 
-    cleanded_string = re.sub(r"\D+", "", string, re.MULTILINE)
+    cleanded_string = NON_DIGIT_PATTERN.sub("", string)
 
     return cleanded_string
 
@@ -58,19 +121,20 @@ Author = namedtuple("Person", ["given_name", "family_name", "title"])
 class VisualLibraryExportElement(ABC):
     """A base class for all classes that can be instantiated from Visual Library XML data."""
 
-    ATTRIBUTE_METADATA_ID = "DMDID".lower()
-    ATTRIBUTE_URI_VALUE_STRING = "valueuri"
+    ATTRIBUTE_METADATA_ID = "DMDID"
+    ATTRIBUTE_URI_VALUE_STRING = "valueURI"
     AUTHORITY_STRING = "authority"
-    HREF_LINK_STRING = "xlink:href"
-    ID_STRING = "id"
-    KEY_DATE_STRING = "keydate"
-    LOCTYPE_STRING = "loctype"
+    HREF_LINK_STRING = XLINK_HREF_STRING
+    ID_STRING = "ID"
+    KEY_DATE_STRING = "keyDate"
+    LOCTYPE_STRING = "LOCTYPE"
     MARCRELATOR_STRING = "marcrelator"
     PAGE_STRING = "page"
     PHYSICAL_STRING = "PHYSICAL"
     PUBLISHER_SHORT_STRING = "isb"
     TRANSLATED_STRING = "translated"
-    TYPE_STRING = "type"
+    TYPE_STRING = "TYPE"
+    MODS_TYPE_STRING = "type"
     URL_STRING = "URL"
     YES_STRING = "yes"
 
@@ -78,31 +142,114 @@ class VisualLibraryExportElement(ABC):
     ISO_LANGUAGE_ENGLISH = "eng"
     ISO_LANGUAGE_FRENCH = "fre"
 
-    METS_TAG_DIV_STRING = "mets:div"
-    METS_TAG_RESOURCE_POINTER_STRING = "mets:mptr"
-    METS_TAG_STRUCTMAP_STRING = "mets:structmap"
-    METS_TAG_XML_DATA_STRING = "mets:xmldata"
-
-    MODS_TAG_CAPTION_STRING = "mods:caption"
-    MODS_TAG_DETAIL_STRING = "mods:detail"
-    MODS_TAG_DISPLAY_NAME_STRING = "mods:displayform"
-    MODS_TAG_LANGUAGE_STRING = "mods:language"
-    MODS_TAG_LANGUAGE_TERM_STRING = "mods:languageterm"
-    MODS_TAG_NAME_PART = "mods:namepart"
-    MODS_TAG_NAME_STRING = "mods:name"
-    MODS_TAG_NON_SORT_STRING = "mods:nonsort"
-    MODS_TAG_NUMBER_STRING = "mods:number"
-    MODS_TAG_ORIGIN_INFO_STRING = "mods:origininfo"
-    MODS_TAG_PART_STRING = "mods:part"
-    MODS_TAG_PUBLICATION_DATE_ISSUED_STRING = "mods:dateissued"
-    MODS_TAG_PUBLICATION_DATE_STRING = "mods:date"
-    MODS_TAG_RELATED_ITEM = "mods:relateditem"
-    MODS_TAG_ROLE_STRING = "mods:roleterm"
-    MODS_TAG_SUBJECT_STRING = "mods:subject"
-    MODS_TAG_SUBTITLE_STRING = "mods:subtitle"
-    MODS_TAG_TITLE_INFO_STRING = "mods:titleinfo"
-    MODS_TAG_TITLE_STRING = "mods:title"
-    MODS_TAG_LICENSE_INFO = "mods:accesscondition"
+    METS_TAG_DIV_STRING = get_qualified_name("mets:div")
+    METS_TAG_RESOURCE_POINTER_STRING = get_qualified_name("mets:mptr")
+    METS_TAG_STRUCTMAP_STRING = get_qualified_name("mets:structMap")
+    METS_TAG_XML_DATA_STRING = get_qualified_name("mets:xmlData")
+
+    MODS_TAG_CAPTION_STRING = get_qualified_name("mods:caption")
+    MODS_TAG_DETAIL_STRING = get_qualified_name("mods:detail")
+    MODS_TAG_DISPLAY_NAME_STRING = get_qualified_name("mods:displayForm")
+    MODS_TAG_LANGUAGE_STRING = get_qualified_name("mods:language")
+    MODS_TAG_LANGUAGE_TERM_STRING = get_qualified_name("mods:languageTerm")
+    MODS_TAG_MODS_STRING = get_qualified_name("mods:mods")
+    MODS_TAG_NAME_PART = get_qualified_name("mods:namePart")
+    MODS_TAG_NAME_STRING = get_qualified_name("mods:name")
+    MODS_TAG_NON_SORT_STRING = get_qualified_name("mods:nonSort")
+    MODS_TAG_NUMBER_STRING = get_qualified_name("mods:number")
+    MODS_TAG_ORIGIN_INFO_STRING = get_qualified_name("mods:originInfo")
+    MODS_TAG_PART_STRING = get_qualified_name("mods:part")
+    MODS_TAG_PUBLICATION_DATE_ISSUED_STRING = get_qualified_name("mods:dateIssued")
+    MODS_TAG_PUBLICATION_DATE_STRING = get_qualified_name("mods:date")
+    MODS_TAG_RELATED_ITEM = get_qualified_name("mods:relatedItem")
+    MODS_TAG_ROLE_STRING = get_qualified_name("mods:roleTerm")
+    MODS_TAG_SUBJECT_STRING = get_qualified_name("mods:subject")
+    MODS_TAG_SUBTITLE_STRING = get_qualified_name("mods:subTitle")
+    MODS_TAG_TITLE_INFO_STRING = get_qualified_name("mods:titleInfo")
+    MODS_TAG_TITLE_STRING = get_qualified_name("mods:title")
+    MODS_TAG_LICENSE_INFO = get_qualified_name("mods:accessCondition")
+
+    # Descendant paths of the MODS tags searched for most often
+    CAPTION_PATH = ".//" + MODS_TAG_CAPTION_STRING
+    DISPLAY_NAME_PATH = ".//" + MODS_TAG_DISPLAY_NAME_STRING
+    LANGUAGE_PATH = ".//" + MODS_TAG_LANGUAGE_STRING
+    LANGUAGE_TERM_PATH = ".//" + MODS_TAG_LANGUAGE_TERM_STRING
+    LICENSE_INFO_PATH = ".//" + MODS_TAG_LICENSE_INFO
+    MODS_PATH = ".//" + MODS_TAG_MODS_STRING
+    NAME_PART_PATH = ".//" + MODS_TAG_NAME_PART
+    NAME_PATH = ".//" + MODS_TAG_NAME_STRING
+    NON_SORT_PATH = ".//" + MODS_TAG_NON_SORT_STRING
+    NUMBER_PATH = ".//" + MODS_TAG_NUMBER_STRING
+    PART_PATH = ".//" + MODS_TAG_PART_STRING
+    SUBJECT_PATH = ".//" + MODS_TAG_SUBJECT_STRING
+    SUBTITLE_PATH = ".//" + MODS_TAG_SUBTITLE_STRING
+    TITLE_INFO_PATH = ".//" + MODS_TAG_TITLE_INFO_STRING
+    TITLE_PATH = ".//" + MODS_TAG_TITLE_STRING
+
+    # Path expressions with constant predicates are built once
+    ISSUE_DETAIL_PATH = ".//{tag}[@{type}='issue']".format(
+        tag=MODS_TAG_DETAIL_STRING, type=MODS_TYPE_STRING
+    )
+    MARCRELATOR_ROLE_PATH = ".//{tag}[@{authority}='{marcrelator}']".format(
+        tag=MODS_TAG_ROLE_STRING,
+        authority=AUTHORITY_STRING,
+        marcrelator=MARCRELATOR_STRING,
+    )
+    PAGE_DIVISION_PATH = ".//{tag}[@{type}='{page}']".format(
+        tag=METS_TAG_DIV_STRING, type=TYPE_STRING, page=PAGE_STRING
+    )
+    PHYSICAL_STRUCTURE_MAP_PATH = ".//{tag}[@{type}='{physical}']".format(
+        tag=METS_TAG_STRUCTMAP_STRING, type=TYPE_STRING, physical=PHYSICAL_STRING
+    )
+    TOP_LOGICAL_DIVISION_PATH = ".//{tag}[@{type}='{logical}']//{div}".format(
+        tag=METS_TAG_STRUCTMAP_STRING,
+        type=MetsImporter.TYPE_STRING,
+        logical=MetsImporter.LOGICAL_STRING,
+        div=METS_TAG_DIV_STRING,
+    )
+    TRANSLATED_TITLE_INFO_PATH = ".//{tag}[@{type}='{translated}']".format(
+        tag=MODS_TAG_TITLE_INFO_STRING,
+        type=MODS_TYPE_STRING,
+        translated=TRANSLATED_STRING,
+    )
+    URL_RESOURCE_POINTER_PATH = "{tag}[@{loctype}='{url}']".format(
+        tag=METS_TAG_RESOURCE_POINTER_STRING, loctype=LOCTYPE_STRING, url=URL_STRING
+    )
+    VOLUME_DETAIL_PATH = ".//{tag}[@{type}='volume']".format(
+        tag=MODS_TAG_DETAIL_STRING, type=MODS_TYPE_STRING
+    )
+
+    # The metadata is extracted lazily, since most callers only need a part of it
+    journal_label = lazy_metadata_property(
+        "journal_label", "_extract_top_parent_data_from_metadata"
+    )
+    journal_id = lazy_metadata_property(
+        "journal_id", "_extract_top_parent_data_from_metadata"
+    )
+    keywords = lazy_metadata_property(
+        "keywords", "_extract_keywords_from_metadata", default=list
+    )
+    languages = lazy_metadata_property(
+        "languages", "_extract_languages_from_metadata", default=list
+    )
+    license = lazy_metadata_property("license", "_extract_license_from_metadata")
+    publication_date = lazy_metadata_property(
+        "publication_date", "_extract_publication_date_from_metadata"
+    )
+    publishers = lazy_metadata_property(
+        "publishers", "_extract_publisher_from_metadata"
+    )
+    title = lazy_metadata_property("title", "_extract_titles_from_metadata")
+    subtitle = lazy_metadata_property("subtitle", "_extract_titles_from_metadata")
+    prefix = lazy_metadata_property("prefix", "_extract_titles_from_metadata")
+    volume_number = lazy_metadata_property("volume_number", "_extract_parent_metadata")
+    issue_number = lazy_metadata_property("issue_number", "_extract_parent_metadata")
+    teaser_image_url = lazy_metadata_property(
+        "teaser_image_url", "_extract_teaser_image_url_from_metadata"
+    )
+    teaser_image_file = lazy_metadata_property(
+        "teaser_image_file", "_extract_teaser_image_url_from_metadata"
+    )
 
     def __init__(self, vl_id, xml_importer, parent):
         self.xml_importer = xml_importer
@@ -110,41 +257,21 @@ class VisualLibraryExportElement(ABC):
         self.id = vl_id
         self.url = self._generate_element_url()
 
+        self._full_text: str = None
         self._number = None
         self._own_section = self._get_own_sections()
         self._pages: list = None
         self._parent = parent
+        self._section_positions_by_label = None
+
+        self._extracted_metadata = set()
 
         self.files = self._own_section.files
-        self.journal_label = None
-        self.journal_id = None
-        self.keywords = []
         self.label = self._own_section.label
-        self.languages = []
-        self.license = None
         self.metadata = self._own_section.metadata
         self.order = self._own_section.order
-        self.publication_date = None
-        self.publishers = None
         self.sections = self._own_section.sections
-        self.subtitle = None
-        self.title = None
-        self.prefix = None
-        self.volume_number = None
-        self.issue_number = None
         self.pdf_url = self._extract_pdf_url_from_metadata()
-        self.teaser_image_url = None
-        self.teaser_image_file = None
-
-        self._extract_top_parent_data_from_metadata()
-        self._extract_parent_metadata()
-        self._extract_keywords_from_metadata()
-        self._extract_languages_from_metadata()
-        self._extract_publication_date_from_metadata()
-        self._extract_publisher_from_metadata()
-        self._extract_titles_from_metadata()
-        self._extract_license_from_metadata()
-        self._extract_teaser_image_url_from_metadata()
 
         logger.info(
             "Created new {class_name}. ID: {id}".format(
@@ -177,7 +304,10 @@ class VisualLibraryExportElement(ABC):
 
     @property
     def full_text(self) -> str:
-        return "\n".join([page.full_text for page in self.pages])
+        if self._full_text is None:
+            self._full_text = "\n".join([page.full_text for page in self.pages])
+
+        return self._full_text
 
     @property
     def pages(self) -> list:
@@ -186,17 +316,13 @@ class VisualLibraryExportElement(ABC):
         """
         if self._pages is None:
             self._pages = []
-            pages_in_article = self.xml_data.find(
-                self.METS_TAG_STRUCTMAP_STRING, {self.TYPE_STRING: self.PHYSICAL_STRING}
-            )
+            pages_in_article = self.xml_data.find(self.PHYSICAL_STRUCTURE_MAP_PATH)
 
             if pages_in_article is None:
                 self._pages = []
                 return self._pages
 
-            pages = pages_in_article.find_all(
-                self.METS_TAG_DIV_STRING, attrs={self.TYPE_STRING: self.PAGE_STRING}
-            )
+            pages = pages_in_article.iterfind(self.PAGE_DIVISION_PATH)
             self._pages = [Page(page, self.xml_data) for page in pages]
 
         return self._pages
@@ -221,7 +347,9 @@ class VisualLibraryExportElement(ABC):
         if self.label == section_label:
             return self._own_section
 
-        for section in self.sections:
+        # A section with exactly the searched label is a hit. Only the sections before it have to be compared.
+        exact_match_position = self._get_section_positions_by_label().get(section_label)
+        for section in self.sections[:exact_match_position]:
             if section.label is None:
                 continue
 
@@ -238,51 +366,47 @@ class VisualLibraryExportElement(ABC):
                         section_label, parent_labels, recursive=True
                     )
 
+        if exact_match_position is not None:
+            return self.sections[exact_match_position]
+
         return None
 
-    def _add_translated_titles_to_title(self, translated_title_elements):
-        primary_language = self._guess_primary_language()
+    def _get_section_positions_by_label(self) -> dict:
+        """Returns the position of the first section in self.sections for each section label."""
 
-        title = self.title
-        subtitle = self.subtitle
-        prefix = self.prefix
+        if self._section_positions_by_label is None:
+            self._section_positions_by_label = {}
+            for position, section in enumerate(self.sections):
+                if section.label is not None:
+                    self._section_positions_by_label.setdefault(section.label, position)
 
-        self.title = {primary_language: title}
-        self.subtitle = {primary_language: subtitle}
-        self.prefix = {primary_language: prefix}
+        return self._section_positions_by_label
 
+    def _get_translated_language(self, primary_language):
         if primary_language != self.ISO_LANGUAGE_GERMAN:
-            translated_language = self.ISO_LANGUAGE_GERMAN
-        else:
-            # Assumes that a translated title of a german article is always in English
-            translated_language = self.ISO_LANGUAGE_ENGLISH
+            return self.ISO_LANGUAGE_GERMAN
 
-        translated_title_element = translated_title_elements[0]
-        self.title[translated_language] = translated_title_element.find(
-            self.MODS_TAG_TITLE_STRING
-        ).text
+        # Assumes that a translated title of a german article is always in English
+        return self.ISO_LANGUAGE_ENGLISH
 
-        prefix_translated_title = translated_title_element.find(
-            self.MODS_TAG_NON_SORT_STRING
-        )
+    def _get_translated_title_parts(self, translated_title_element) -> tuple:
+        """Returns the (title, subtitle, prefix) tuple of a translated title info element."""
+
+        title = get_element_text(translated_title_element.find(self.TITLE_PATH))
+
+        prefix_element = translated_title_element.find(self.NON_SORT_PATH)
         prefix = (
-            prefix_translated_title.text
-            if prefix_translated_title is not None
-            else None
+            get_element_text(prefix_element) if prefix_element is not None else None
         )
-        self.prefix[translated_language] = prefix
         if prefix is not None:
-            self.title[translated_language] = "{prefix} {title}".format(
-                prefix=prefix, title=self.title[translated_language]
-            )
+            title = "{prefix} {title}".format(prefix=prefix, title=title)
 
-        translated_subtitle_element = translated_title_element.find(
-            self.MODS_TAG_SUBTITLE_STRING
+        subtitle_element = translated_title_element.find(self.SUBTITLE_PATH)
+        subtitle = (
+            get_element_text(subtitle_element) if subtitle_element is not None else None
         )
-        if translated_subtitle_element is not None:
-            self.subtitle[translated_language] = translated_subtitle_element.text
-        else:
-            self.subtitle[translated_language] = None
+
+        return title, subtitle, prefix
 
     def _create_section_instance(self, xml_importer: MetsImporter, url: str):
         """Finds the appropriate class for a section.
@@ -299,7 +423,9 @@ class VisualLibraryExportElement(ABC):
             return None
 
         section_id = re.search(r"(?<=identifier=)[0-9]*", url).group()
-        section_type = get_object_type_from_xml(xml_importer.xml_data, section_id)
+        section_type = get_object_type_from_xml(
+            xml_importer.xml_data, section_id, xml_importer.metadata_sections_by_id
+        )
         if section_type is not None:
             return section_type(section_id, xml_importer, parent=self)
 
@@ -308,22 +434,25 @@ class VisualLibraryExportElement(ABC):
         In the most cases, this should be the journal name.
         """
 
-        top_parent_node = self.xml_data.find(
-            self.METS_TAG_STRUCTMAP_STRING,
-            {MetsImporter.TYPE_STRING: MetsImporter.LOGICAL_STRING},
-        ).find(self.METS_TAG_DIV_STRING)
+        top_parent_node = self.xml_data.find(self.TOP_LOGICAL_DIVISION_PATH)
 
-        top_parent_metadata_id = top_parent_node[self.ATTRIBUTE_METADATA_ID]
-        top_parent_metadata = self.xml_data.find(id=top_parent_metadata_id)
+        top_parent_metadata_id = top_parent_node.get(self.ATTRIBUTE_METADATA_ID)
+        top_parent_metadata = get_first_xpath_result(
+            MetsImporter.ELEMENT_BY_ID_XPATH,
+            self.xml_data,
+            element_id=top_parent_metadata_id,
+        )
 
-        title = top_parent_metadata.find(self.MODS_TAG_TITLE_STRING)
-        subtitle = top_parent_metadata.find(self.MODS_TAG_SUBTITLE_STRING)
+        title = top_parent_metadata.find(self.TITLE_PATH)
+        subtitle = top_parent_metadata.find(self.SUBTITLE_PATH)
 
         journal_label = ""
         if title is not None:
-            journal_label = clean_up_string(title.text)
+            journal_label = clean_up_string(get_element_text(title))
         if subtitle is not None:
-            journal_label = f"{journal_label}: {clean_up_string(subtitle.text)}"
+            journal_label = (
+                f"{journal_label}: {clean_up_string(get_element_text(subtitle))}"
+            )
 
         self.journal_label = journal_label
         journal_id_search = re.search(r"md([0-9]*)", top_parent_metadata_id)
@@ -334,43 +463,37 @@ class VisualLibraryExportElement(ABC):
     def _extract_keywords_from_metadata(self):
         """If keywords are present, they will be set."""
 
-        subject_elements = self.metadata.find_all(self.MODS_TAG_SUBJECT_STRING)
+        subject_elements = self.metadata.iterfind(self.SUBJECT_PATH)
 
-        self.keywords = [subject.text for subject in subject_elements]
+        self.keywords = [get_element_text(subject) for subject in subject_elements]
 
     def _extract_languages_from_metadata(self):
         """Sets the language property with the appropriate data."""
 
-        languages_element = self.metadata.find(self.MODS_TAG_LANGUAGE_STRING)
+        languages_element = self.metadata.find(self.LANGUAGE_PATH)
 
         if languages_element is None:
             return
 
         self.languages = [
-            language.text
-            for language in languages_element.find_all(
-                self.MODS_TAG_LANGUAGE_TERM_STRING
-            )
+            get_element_text(language)
+            for language in languages_element.iterfind(self.LANGUAGE_TERM_PATH)
         ]
 
     def _extract_parent_metadata(self):
-        volume_number = self._own_section.metadata.find(
-            "mods:detail", {self.TYPE_STRING: "volume"}
-        )
-        issue_number = self._own_section.metadata.find(
-            "mods:detail", {self.TYPE_STRING: "issue"}
-        )
+        volume_number = self._own_section.metadata.find(self.VOLUME_DETAIL_PATH)
+        issue_number = self._own_section.metadata.find(self.ISSUE_DETAIL_PATH)
 
         if volume_number is not None:
-            actual_number = volume_number.find("mods:number")
+            actual_number = volume_number.find(self.NUMBER_PATH)
             self.volume_number = (
-                actual_number.text if actual_number is not None else None
+                get_element_text(actual_number) if actual_number is not None else None
             )
 
         if issue_number is not None:
-            actual_number = issue_number.find("mods:number")
+            actual_number = issue_number.find(self.NUMBER_PATH)
             self.issue_number = (
-                actual_number.text if actual_number is not None else None
+                get_element_text(actual_number) if actual_number is not None else None
             )
 
     def _extract_publication_date_from_metadata(self, year_only: bool = False):
@@ -384,19 +507,18 @@ class VisualLibraryExportElement(ABC):
         re_year_only = re.compile(r"\D*[0-9]{4}(?!-)\D*")
         re_date_period = re.compile(r"(?<!.)[0-9]{4}-(?:[0-9]{4})?")
         for origin_element in origin_info_elements:
-            dates = origin_element.find_all(
-                [
-                    self.MODS_TAG_PUBLICATION_DATE_ISSUED_STRING,
-                    self.MODS_TAG_PUBLICATION_DATE_STRING,
-                ]
+            dates = origin_element.iter(
+                self.MODS_TAG_PUBLICATION_DATE_ISSUED_STRING,
+                self.MODS_TAG_PUBLICATION_DATE_STRING,
             )
             for date_element in dates:
-                date_period_result = re_date_period.match(date_element.text)
+                date_text = get_element_text(date_element)
+                date_period_result = re_date_period.match(date_text)
                 if not year_only and date_period_result:
                     self.publication_date = date_period_result.group()
                     return
 
-                year_only_result = re_year_only.match(date_element.text)
+                year_only_result = re_year_only.match(date_text)
                 if year_only_result:
                     self.publication_date = remove_letters_from_alphanumeric_string(
                         year_only_result.group()
@@ -413,10 +535,10 @@ class VisualLibraryExportElement(ABC):
         )
         publishers = []
         for publisher in publishers_in_metadata:
-            publisher_name = publisher.find(self.MODS_TAG_DISPLAY_NAME_STRING)
+            publisher_name = publisher.find(self.DISPLAY_NAME_PATH)
             if publisher_name is None:
-                publisher_name = publisher.find(self.MODS_TAG_NAME_PART)
-            publisher_name = publisher_name.text
+                publisher_name = publisher.find(self.NAME_PART_PATH)
+            publisher_name = get_element_text(publisher_name)
 
             publisher_uri = publisher.get(self.ATTRIBUTE_URI_VALUE_STRING, "")
             publishers.append(Publisher(publisher_name, publisher_uri))
@@ -426,48 +548,59 @@ class VisualLibraryExportElement(ABC):
     def _extract_titles_from_metadata(self):
         """Sets both the title and subtitle data with the appropriate data."""
 
-        title_info_element = self.metadata.find(self.MODS_TAG_TITLE_INFO_STRING)
+        title_info_element = self.metadata.find(self.TITLE_INFO_PATH)
 
         if title_info_element is None:
             return None
 
-        title_element = title_info_element.find(self.MODS_TAG_TITLE_STRING)
+        title = subtitle = prefix = None
+        title_element = title_info_element.find(self.TITLE_PATH)
 
         if title_element is not None:
-            self.title = title_element.text.strip()
+            title = get_element_text(title_element).strip()
 
-            prefix_tag = title_element.find(self.MODS_TAG_NON_SORT_STRING)
+            prefix_tag = title_element.find(self.NON_SORT_PATH)
             if prefix_tag is not None:
-                self.prefix = prefix_tag.text.strip()
-                self.title = "{prefix} {title}".format(
-                    prefix=self.prefix, title=self.title
-                )
+                prefix = get_element_text(prefix_tag).strip()
+                title = "{prefix} {title}".format(prefix=prefix, title=title)
 
-        subtitle_element = title_info_element.find(self.MODS_TAG_SUBTITLE_STRING)
+        subtitle_element = title_info_element.find(self.SUBTITLE_PATH)
         if subtitle_element is not None:
-            self.subtitle = subtitle_element.text.strip()
+            subtitle = get_element_text(subtitle_element).strip()
 
-        translated_title_elements = self.metadata.find_all(
-            self.MODS_TAG_TITLE_INFO_STRING, {self.TYPE_STRING: self.TRANSLATED_STRING}
-        )
+        # Only the first translated title is taken into account
+        translated_title_element = self.metadata.find(self.TRANSLATED_TITLE_INFO_PATH)
 
-        if translated_title_elements:
-            self._add_translated_titles_to_title(translated_title_elements)
+        if translated_title_element is None:
+            self.title, self.subtitle, self.prefix = title, subtitle, prefix
+            return None
+
+        primary_language = self._guess_primary_language()
+        translated_language = self._get_translated_language(primary_language)
+        (
+            translated_title,
+            translated_subtitle,
+            translated_prefix,
+        ) = self._get_translated_title_parts(translated_title_element)
+
+        self.title = {primary_language: title, translated_language: translated_title}
+        self.subtitle = {
+            primary_language: subtitle,
+            translated_language: translated_subtitle,
+        }
+        self.prefix = {primary_language: prefix, translated_language: translated_prefix}
 
     def _extract_license_from_metadata(self):
-        license_element = self.metadata.find(self.MODS_TAG_LICENSE_INFO)
+        license_element = self.metadata.find(self.LICENSE_INFO_PATH)
 
         if license_element is None:
             return None
-        
-        try:
-            self.license = license_element[self.HREF_LINK_STRING]
-        except KeyError:
-            self.license = license_element.get(self.HREF_LINK_STRING)
+
+        self.license = license_element.get(self.HREF_LINK_STRING)
 
     def _extract_teaser_image_url_from_metadata(self):
         for pointer_data in self._own_section.file_pointers_data:
-            file_id = pointer_data.attrs.get("fileid")
+            file_id = pointer_data.get(MetsImporter.ATTRIBUTE_FILE_ID_STRING)
             if "TEASER" in file_id:
                 file_section = self.xml_importer.resolve_resource_pointer(pointer_data)
                 if file_section is not None:
@@ -476,9 +609,9 @@ class VisualLibraryExportElement(ABC):
                     self.teaser_image_file.url = file_section.url
 
     def _get_mods_caption_if_available(self):
-        mods_captions = self._own_section.metadata.find(self.MODS_TAG_PART_STRING)
+        mods_captions = self._own_section.metadata.find(self.PART_PATH)
         if mods_captions is not None:
-            title_info_element = mods_captions.find(self.MODS_TAG_CAPTION_STRING)
+            title_info_element = mods_captions.find(self.CAPTION_PATH)
             if title_info_element is not None:
                 return title_info_element
         else:
@@ -489,38 +622,38 @@ class VisualLibraryExportElement(ABC):
         This function is used for finding e.g. authors and publishers.
         """
 
-        def is_searched_role(person_element, role_type):
-            role_string_in_element = person_element.find(
-                self.MODS_TAG_ROLE_STRING,
-                {self.AUTHORITY_STRING: self.MARCRELATOR_STRING},
-            )
-            if role_string_in_element is not None:
-                return role_string_in_element.text == role_type
-            else:
-                return False
+        return self._get_authority_elements_by_roles([role_type])[role_type]
 
-        persons_in_metadata = self.metadata.find_all(self.MODS_TAG_NAME_STRING)
-        persons_in_metadata = [
-            person
-            for person in persons_in_metadata
-            if person.parent.name != self.MODS_TAG_RELATED_ITEM
-        ]
+    def _get_authority_elements_by_roles(self, role_types: list) -> dict:
+        """Finds all metadata elements having one of the given roles in a single pass over the metadata.
+        :param role_types: The MARC relator codes to search for.
+        :type role_types: list
+        :returns: The matching elements (in document order) for each given role.
+        :rtype: dict
+        """
 
-        persons_in_given_role = [
-            person_element
-            for person_element in persons_in_metadata
-            if is_searched_role(person_element, role_type)
-        ]
+        persons_by_role = {role_type: [] for role_type in role_types}
+        for person in self.metadata.iterfind(self.NAME_PATH):
+            if person.getparent().tag == self.MODS_TAG_RELATED_ITEM:
+                continue
 
-        return persons_in_given_role
+            role_string_in_element = person.find(self.MARCRELATOR_ROLE_PATH)
+            if role_string_in_element is None:
+                continue
+
+            persons_in_role = persons_by_role.get(
+                get_element_text(role_string_in_element)
+            )
+            if persons_in_role is not None:
+                persons_in_role.append(person)
+
+        return persons_by_role
 
     def _get_date_elements_from_metadata(self) -> list:
-        mods_data = self.metadata.find("mods:mods")
-        relevant_elements = mods_data.find_all(
-            self.MODS_TAG_ORIGIN_INFO_STRING, recursive=False
-        )
+        mods_data = self.metadata.find(self.MODS_PATH)
+        relevant_elements = mods_data.findall(self.MODS_TAG_ORIGIN_INFO_STRING)
         if not relevant_elements:
-            relevant_elements = self.metadata.find_all(self.MODS_TAG_PART_STRING)
+            relevant_elements = self.metadata.findall(self.PART_PATH)
 
         return relevant_elements
 
@@ -529,12 +662,10 @@ class VisualLibraryExportElement(ABC):
 
     def _get_parent(self):
         section_id = self._own_section.id
-        parent_element = self.xml_data.find(attrs={self.ID_STRING: section_id}).parent
-        parent_url_element = parent_element.find(
-            self.METS_TAG_RESOURCE_POINTER_STRING,
-            {self.LOCTYPE_STRING: self.URL_STRING},
-            recursive=False,
-        )
+        parent_element = get_first_xpath_result(
+            MetsImporter.ELEMENT_BY_ID_XPATH, self.xml_data, element_id=section_id
+        ).getparent()
+        parent_url_element = parent_element.find(self.URL_RESOURCE_POINTER_PATH)
         if parent_url_element is not None:
             parent_url = parent_url_element.get(self.HREF_LINK_STRING)
             parent_id_result = re.search(
@@ -553,44 +684,62 @@ class VisualLibraryExportElement(ABC):
         else:
             return None
 
-    def _resolve_depending_sections(self):
-        """Returns a generator that iterates this object's sections.
-        The sections are returned as VisualLibraryExportElement instances.
-        """
+    def _resolve_depending_sections(self) -> list:
+        """Returns this object's sections as VisualLibraryExportElement instances."""
 
-        for section in self.sections:
-            for instance in self._resolve_resource_pointers(section):
-                yield instance
+        urls = [
+            url
+            for section in self.sections
+            for url in self._get_resource_pointer_urls(section)
+        ]
+
+        return self._create_section_instances(urls)
 
     def _resolve_resource_pointers(self, section: MetsImporter.Section) -> list:
         """Resolves any subsection's URL references to other Visual Library objects.
         :returns: A list of section instances that could be resolved.
         """
 
-        instantiated_sections = []
-        for resource in section.resource_pointers:
-            if resource.get(self.LOCTYPE_STRING) == self.URL_STRING:
-                url = resource.get(self.HREF_LINK_STRING)
-                xml_importer = MetsImporter()
-                if url is not None:
-                    instantiated_section_type = self._create_section_instance(
-                        xml_importer, url
-                    )
-                    if instantiated_section_type is not None:
-                        instantiated_sections.append(instantiated_section_type)
+        return self._create_section_instances(self._get_resource_pointer_urls(section))
 
-        return instantiated_sections
+    def _get_resource_pointer_urls(self, section: MetsImporter.Section) -> list:
+        return [
+            resource.get(self.HREF_LINK_STRING)
+            for resource in section.resource_pointers
+            if resource.get(self.LOCTYPE_STRING) == self.URL_STRING
+            and resource.get(self.HREF_LINK_STRING) is not None
+        ]
+
+    def _create_section_instances(self, urls: list) -> list:
+        """Creates the section instances for the given URLs in their order.
+        Every section is fetched from its own URL, hence the sections are downloaded and parsed concurrently.
+        """
+
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(urls), MetsImporter.MAX_DOWNLOAD_WORKERS)
+        ) as executor:
+            instances = executor.map(
+                lambda url: self._create_section_instance(MetsImporter(), url), urls
+            )
+            return [instance for instance in instances if instance is not None]
 
     def _get_number_from_metadata_details_by_attribute(
         self, detail_node_attributes: dict
     ) -> (str, None):
+        attribute_predicates = "".join(
+            "[@{name}='{value}']".format(name=name, value=value)
+            for name, value in detail_node_attributes.items()
+        )
         try:
-            info_node = self.metadata.find(self.MODS_TAG_PART_STRING).find(
-                self.MODS_TAG_DETAIL_STRING, detail_node_attributes
+            info_node = self.metadata.find(self.PART_PATH).find(
+                ".//" + self.MODS_TAG_DETAIL_STRING + attribute_predicates
             )
 
-            return info_node.find(self.MODS_TAG_NUMBER_STRING).text
-        except AttributeError:
+            return get_element_text(info_node.find(self.NUMBER_PATH))
+        except (AttributeError, TypeError):
             return None
 
     def _extract_pdf_url_from_metadata(self) -> Optional[str]:
@@ -733,7 +882,7 @@ class Issue(ArticleHandlingExportElement):
 
         # Issues and Volumes may not have a title
         if caption_info_element is not None:
-            self.title = caption_info_element.text.strip()
+            self.title = get_element_text(caption_info_element).strip()
             return None
         else:
             super(Issue, self)._extract_titles_from_metadata()
@@ -745,17 +894,22 @@ class Page:
     and generated.
     """
 
-    ALTO_TAG_SPACE_STRING = "sp"
-    ALTO_TAG_TEXT_LINE_STRING = "textline"
-    ALTO_TAG_WORD_STRING = "string"
-
-    CONTENT_STRING = "content"
-    FILE_ID_STRING = "fileid"
-    ID_STRING = "id"
-    LABEL_STRING = "label"
-    METS_TAG_FILE_POINTER = "mets:fptr"
-    METS_TAG_FILE_STRING = "mets:file"
-    ORDER_STRING = "order"
+    ALTO_TAG_SPACE_STRING = "{*}SP"
+    ALTO_TAG_TEXT_LINE_STRING = "{*}TextLine"
+    ALTO_TAG_WORD_STRING = "{*}String"
+
+    CONTENT_STRING = "CONTENT"
+    FILE_ID_STRING = "FILEID"
+    ID_STRING = "ID"
+    LABEL_STRING = "LABEL"
+    METS_TAG_FILE_POINTER = get_qualified_name("mets:fptr")
+    METS_TAG_FILE_STRING = get_qualified_name("mets:file")
+    ORDER_STRING = "ORDER"
+
+    FILE_POINTER_PATH = ".//" + METS_TAG_FILE_POINTER
+    FILE_BY_ID_XPATH = etree.XPath(
+        ".//mets:file[@{id}=$file_id]".format(id=ID_STRING), namespaces=NAMESPACES
+    )
 
     SUBSTRING_IN_DEFAULT_SCAN_IMAGE_ID = "DEFAULT"
     SUBSTRING_IN_FULL_TEXT_ID = "ALTO"
@@ -764,37 +918,35 @@ class Page:
     SUBSTRING_IN_THUMBNAIL_ID = "THUMBS"
 
     def __init__(self, page_element, xml_data):
-        self.full_text = None
-        self.full_text_xml = None
-        self.image_default_resolution = None
-        self.image_max_resolution = None
-        self.image_min_resolution = None
         self._page_element = page_element
         self.label = page_element.get(self.LABEL_STRING)
         self.order = page_element.get(self.ORDER_STRING)
         self.id = self._extract_page_id_from_metadata(page_element)
         self.vl_id = self._extract_vl_page_id_from_metadata(page_element)
 
-        self._file_pointer = self._page_element.find_all(self.METS_TAG_FILE_POINTER)
+        self._file_pointer = self._page_element.findall(self.FILE_POINTER_PATH)
         self._xml_data = xml_data
+        self._full_text: str = None
+        self._image_files_by_id_substring = {}
 
-        logger.debug("Created new Page object. ID {id}".format(id=self.id))
+        logger.debug("Created new Page object. ID %s", self.id)
 
     @property
     def full_text(self) -> (str, None):
         """Returns the page's full text as string.
         Returns None, if no full text could be found.
+        The text is downloaded and parsed only on first access.
         """
 
-        text_file = self._get_file_from_id_substring(self.SUBSTRING_IN_FULL_TEXT_ID)
+        if self._full_text is None:
+            text_file = self._get_file_from_id_substring(self.SUBSTRING_IN_FULL_TEXT_ID)
 
-        if text_file is not None:
-            text_file.download_file_data_from_source()
-            return self._parse_alto_xml_to_full_text_string(
-                Soup(text_file.data, MetsImporter.XML_IMPORT_PARSER)
-            )
+            if text_file is not None:
+                self._full_text = self._parse_alto_xml_to_full_text_string(
+                    get_xml_tree_from_string(text_file.data)
+                )
 
-        return None
+        return self._full_text
 
     @property
     def full_text_xml(self) -> File:
@@ -805,60 +957,42 @@ class Page:
     @property
     def image_default_resolution(self) -> File:
         """Returns a File object to the page's default resolution page scan."""
-        return self._get_file_from_id_substring(self.SUBSTRING_IN_DEFAULT_SCAN_IMAGE_ID)
+        return self._get_image_file_from_id_substring(
+            self.SUBSTRING_IN_DEFAULT_SCAN_IMAGE_ID
+        )
 
     @property
     def image_max_resolution(self) -> File:
         """Returns a File object to the page's maximum resolution page scan."""
-        return self._get_file_from_id_substring(self.SUBSTRING_IN_MAX_SCAN_IMAGE_ID)
+        return self._get_image_file_from_id_substring(
+            self.SUBSTRING_IN_MAX_SCAN_IMAGE_ID
+        )
 
     @property
     def image_min_resolution(self) -> File:
         """Returns a File object to the page's minimum resolution page scan."""
-        return self._get_file_from_id_substring(self.SUBSTRING_IN_MIN_SCAN_IMAGE_ID)
+        return self._get_image_file_from_id_substring(
+            self.SUBSTRING_IN_MIN_SCAN_IMAGE_ID
+        )
 
     @property
     def thumbnail(self) -> File:
         """Returns a File object to the page's thumbnail."""
-        return self._get_file_from_id_substring(self.SUBSTRING_IN_THUMBNAIL_ID)
-
-    @full_text.setter
-    def full_text(self, val):
-        function_is_read_only()
-
-    @full_text_xml.setter
-    def full_text_xml(self, val):
-        function_is_read_only()
-
-    @image_default_resolution.setter
-    def image_default_resolution(self, val):
-        function_is_read_only()
-
-    @image_max_resolution.setter
-    def image_max_resolution(self, val):
-        function_is_read_only()
-
-    @image_min_resolution.setter
-    def image_min_resolution(self, val):
-        function_is_read_only()
+        return self._get_image_file_from_id_substring(self.SUBSTRING_IN_THUMBNAIL_ID)
 
-    @thumbnail.setter
-    def thumbnail(self, val):
-        function_is_read_only()
-
-    def _extract_page_id_from_metadata(self, page_metadata: Soup) -> str:
+    def _extract_page_id_from_metadata(self, page_metadata: etree._Element) -> str:
         page_id_string = page_metadata.get(self.ID_STRING)
         return page_id_string.replace("phys", "")
 
-    def _extract_vl_page_id_from_metadata(self, page_metadata: Soup) -> str:
+    def _extract_vl_page_id_from_metadata(self, page_metadata: etree._Element) -> str:
         page_id = self._extract_page_id_from_metadata(page_metadata)
         return re.sub(r"^phys", "", page_id)
 
     def _get_file_from_resource_id(self, resource_id: str) -> File:
         """Creates a File object from resolving a given XML data internal ID."""
 
-        resource_element = self._xml_data.find(
-            self.METS_TAG_FILE_STRING, {self.ID_STRING: resource_id}
+        resource_element = get_first_xpath_result(
+            self.FILE_BY_ID_XPATH, self._xml_data, file_id=resource_id
         )
         try:
             file = File()
@@ -881,21 +1015,31 @@ class Page:
         file_id = resource_pointer.get(self.FILE_ID_STRING)
         return self._get_file_from_resource_id(file_id)
 
-    def _parse_alto_xml_to_full_text_string(self, alto_xml: Soup) -> str:
-        def extract_text_from_tag(word: Soup):
-            if isinstance(word, Tag):
-                return word.get(self.CONTENT_STRING, " ")
-
-        text_lines = alto_xml.find_all(self.ALTO_TAG_TEXT_LINE_STRING)
-        full_text = ""
-        for line in text_lines:
-            line_text_array = [extract_text_from_tag(word) for word in line.children]
-            full_text = "{previous_text}{new_line}\n".format(
-                previous_text=full_text, new_line="".join(line_text_array)
+    def _get_image_file_from_id_substring(self, substring) -> File:
+        """Returns the File object of a page scan.
+        The object is created only once per page, so its data is downloaded at most once.
+        """
+
+        if substring not in self._image_files_by_id_substring:
+            self._image_files_by_id_substring[substring] = (
+                self._get_file_from_id_substring(substring)
             )
 
-        # Skip the last character (which is always a newline)
-        return full_text[:-1]
+        return self._image_files_by_id_substring[substring]
+
+    def _parse_alto_xml_to_full_text_string(self, alto_xml: etree._Element) -> str:
+        def extract_text_from_tag(word: etree._Element):
+            return word.get(self.CONTENT_STRING, " ")
+
+        text_lines = alto_xml.iter(self.ALTO_TAG_TEXT_LINE_STRING)
+
+        # Joined once, as repeated concatenation would copy the growing text for every line
+        return "\n".join(
+            "".join(
+                extract_text_from_tag(word) for word in line.iterchildren(etree.Element)
+            )
+            for line in text_lines
+        )
 
 
 class Article(VisualLibraryExportElement):
@@ -907,15 +1051,24 @@ class Article(VisualLibraryExportElement):
     GIVEN_STRING = "given"
     TITLE_STRING = "termsOfAddress"
 
-    METS_TAG_SECTION_STRING = "mets:dmdsec"
-    MODS_TAG_END_STRING = "mods:end"
-    MODS_TAG_EXTEND_STRING = "mods:extent"
-    MODS_TAG_LIST_STRING = "mods:list"
-    MODS_TAG_NAME_PART_STRING = "mods:namepart"
-    MODS_TAG_START_STRING = "mods:start"
+    METS_TAG_SECTION_STRING = get_qualified_name("mets:dmdSec")
+    MODS_TAG_END_STRING = get_qualified_name("mods:end")
+    MODS_TAG_EXTEND_STRING = get_qualified_name("mods:extent")
+    MODS_TAG_LIST_STRING = get_qualified_name("mods:list")
+    MODS_TAG_NAME_PART_STRING = get_qualified_name("mods:namePart")
+    MODS_TAG_START_STRING = get_qualified_name("mods:start")
 
     UNIT_STRING = "unit"
 
+    END_PATH = ".//" + MODS_TAG_END_STRING
+    LIST_PATH = ".//" + MODS_TAG_LIST_STRING
+    START_PATH = ".//" + MODS_TAG_START_STRING
+    PAGE_EXTENT_PATH = ".//{tag}[@{unit}='{page}']".format(
+        tag=MODS_TAG_EXTEND_STRING,
+        unit=UNIT_STRING,
+        page=VisualLibraryExportElement.PAGE_STRING,
+    )
+
     def __init__(self, vl_id, xml_importer, parent):
         super().__init__(vl_id, xml_importer, parent)
 
@@ -932,27 +1085,19 @@ class Article(VisualLibraryExportElement):
         """Returns a list of author namedtuples from the metadata."""
 
         authors = []
-        author_elements_in_metadata = self._get_authority_element_by_role(
-            self.AUTHOR_SHORT_STRING
-        )
-        participate_elements_in_metadata = self._get_authority_element_by_role(
-            self.PARTICIPATING_PERSON_SHORT_STRING
+        persons_by_role = self._get_authority_elements_by_roles(
+            [self.AUTHOR_SHORT_STRING, self.PARTICIPATING_PERSON_SHORT_STRING]
         )
-        for person in author_elements_in_metadata + participate_elements_in_metadata:
-            given_name = person.find(
-                self.MODS_TAG_NAME_PART_STRING, {self.TYPE_STRING: self.GIVEN_STRING}
-            )
-            family_name = person.find(
-                self.MODS_TAG_NAME_PART_STRING, {self.TYPE_STRING: self.FAMILY_STRING}
-            )
-            display_name = person.find(self.MODS_TAG_DISPLAY_NAME_STRING)
-            title_of_address = person.find(attrs={self.TYPE_STRING: self.TITLE_STRING})
+        for person in (
+            persons_by_role[self.AUTHOR_SHORT_STRING]
+            + persons_by_role[self.PARTICIPATING_PERSON_SHORT_STRING]
+        ):
+            name_parts = self._get_name_parts_of_person(person)
 
-            # Clean names
-            given_name = given_name.text if given_name is not None else ""
-            family_name = family_name.text if family_name is not None else ""
-            title = title_of_address.text if title_of_address is not None else ""
-            display_name = display_name.text if display_name is not None else ""
+            given_name = name_parts.get(self.GIVEN_STRING, "")
+            family_name = name_parts.get(self.FAMILY_STRING, "")
+            title = name_parts.get(self.TITLE_STRING, "")
+            display_name = name_parts.get(self.MODS_TAG_DISPLAY_NAME_STRING, "")
 
             # In the XML the given name is required while the family name is NOT!
             if not given_name and display_name:
@@ -962,23 +1107,39 @@ class Article(VisualLibraryExportElement):
 
         return authors
 
+    def _get_name_parts_of_person(self, person_element: etree._Element) -> dict:
+        """Collects the texts of the given and family name, the title and the display form in a single walk.
+        Only the first occurrence of every part is taken into account.
+        """
+
+        name_parts = {}
+        for element in person_element.iterdescendants(etree.Element):
+            element_type = element.get(self.MODS_TYPE_STRING)
+            if element_type == self.TITLE_STRING or (
+                element.tag == self.MODS_TAG_NAME_PART_STRING
+                and element_type in (self.GIVEN_STRING, self.FAMILY_STRING)
+            ):
+                name_parts.setdefault(element_type, get_element_text(element))
+            elif element.tag == self.MODS_TAG_DISPLAY_NAME_STRING:
+                name_parts.setdefault(element.tag, get_element_text(element))
+
+        return name_parts
+
     def _extract_page_range_from_metadata(self) -> Tuple[namedtuple, None]:
         PageRange = namedtuple("PageRange", ["start", "end"])
-        page_range_element = self.xml_data.find(
-            self.MODS_TAG_EXTEND_STRING, attrs={self.UNIT_STRING: self.PAGE_STRING}
-        )
+        page_range_element = self.xml_data.find(self.PAGE_EXTENT_PATH)
         if page_range_element is not None:
-            start_element = page_range_element.find(self.MODS_TAG_START_STRING)
+            start_element = page_range_element.find(self.START_PATH)
             if start_element is not None:
-                start = start_element.text
-                end_node = page_range_element.find(self.MODS_TAG_END_STRING)
+                start = get_element_text(start_element)
+                end_node = page_range_element.find(self.END_PATH)
 
                 # Set start and end page equal, if no end but only the start page is given
-                end = end_node.text if end_node is not None else start
+                end = get_element_text(end_node) if end_node is not None else start
             else:
-                mods_list = page_range_element.find(self.MODS_TAG_LIST_STRING)
+                mods_list = page_range_element.find(self.LIST_PATH)
                 if mods_list is not None:
-                    start = mods_list.text
+                    start = get_element_text(mods_list)
                     end = ""
                 else:
                     return None
@@ -991,20 +1152,25 @@ class Article(VisualLibraryExportElement):
         """This is a publication in a single moment in time. Hence a year only is forced."""
         return super()._extract_publication_date_from_metadata(year_only)
 
-    def _is_person_element_author(self, person_element: Soup):
+    def _is_person_element_author(self, person_element: etree._Element):
         return (
-            person_element.find(
-                self.MODS_TAG_ROLE_STRING,
-                {self.AUTHORITY_STRING: self.MARCRELATOR_STRING},
-            ).text
+            get_element_text(person_element.find(self.MARCRELATOR_ROLE_PATH))
             == self.AUTHOR_SHORT_STRING
         )
 
 
 # In C++, this would be a forward declaration on top of the file
 # TODO: The resolution of the object type could use a better solution
-RESPONSE_HEADER = "header"
-VL_OBJECT_SPECIFICATION = "setspec"
+RESPONSE_HEADER = "{*}header"
+VL_OBJECT_SPECIFICATION = "{*}setSpec"
+# The paths of the type resolution are built once instead of for every resolved object
+RESPONSE_HEADER_PATH = ".//" + RESPONSE_HEADER
+VL_OBJECT_SPECIFICATION_PATH = ".//" + VL_OBJECT_SPECIFICATION
+SECTION_PATH = ".//" + VisualLibraryExportElement.METS_TAG_DIV_STRING
+SUBSECTION_RESOURCE_POINTER_PATH = ".//{div}//{pointer}".format(
+    div=VisualLibraryExportElement.METS_TAG_DIV_STRING,
+    pointer=VisualLibraryExportElement.METS_TAG_RESOURCE_POINTER_STRING,
+)
 VL_OBJECT_TYPES = {
     "article": Article,
     "book": Volume,
@@ -1016,14 +1182,16 @@ VL_OBJECT_TYPES = {
 }
 
 
-def get_xml_header_from_vl_response(vl_response_xml: Soup) -> Soup:
+def get_xml_header_from_vl_response(
+    vl_response_xml: etree._Element,
+) -> etree._Element:
     """Returns the Header of the Visual Library Response XML."""
 
-    return vl_response_xml.find(RESPONSE_HEADER)
+    return vl_response_xml.find(RESPONSE_HEADER_PATH)
 
 
 def get_object_type_from_xml_header(
-    xml_header: Soup,
+    xml_header: etree._Element,
 ) -> (VisualLibraryExportElement, None):
     """Returns the appropriate object class for the given XML header data.
     The type of the requested object (Journal, Issue, Article, etc.) is not encoded in the Visual Library XML data,
@@ -1031,51 +1199,67 @@ def get_object_type_from_xml_header(
     If no class could be found for the given XML data, None is returned.
     """
 
-    object_specifications = xml_header.find_all(VL_OBJECT_SPECIFICATION)
-    for specification in object_specifications:
-        object_type = VL_OBJECT_TYPES.get(specification.text)
-        if object_type is not None:
-            return object_type
+    specification_texts = (
+        get_element_text(specification)
+        for specification in xml_header.iterfind(VL_OBJECT_SPECIFICATION_PATH)
+    )
 
-    return None
+    return next(
+        (
+            VL_OBJECT_TYPES[text]
+            for text in specification_texts
+            if text in VL_OBJECT_TYPES
+        ),
+        None,
+    )
 
 
-def is_author_in_metadata(metadata: Soup):
-    role_element = metadata.find(
-        VisualLibraryExportElement.MODS_TAG_ROLE_STRING,
-        {
-            VisualLibraryExportElement.AUTHORITY_STRING: VisualLibraryExportElement.MARCRELATOR_STRING
-        },
-    )
+def is_author_in_metadata(metadata: etree._Element):
+    role_element = metadata.find(VisualLibraryExportElement.MARCRELATOR_ROLE_PATH)
 
     return role_element is not None and (
-        role_element.text == Article.AUTHOR_SHORT_STRING
-        or role_element.text == Article.PARTICIPATING_PERSON_SHORT_STRING
+        get_element_text(role_element) == Article.AUTHOR_SHORT_STRING
+        or get_element_text(role_element) == Article.PARTICIPATING_PERSON_SHORT_STRING
     )
 
 
-def get_object_type_from_xml(xml_data: Soup, vl_id: str):
+def get_object_type_from_xml(
+    xml_data: etree._Element, vl_id: str, metadata_sections_by_id: dict = None
+):
+    """Returns the appropriate object class for the given METS data.
+    :param xml_data: The complete XML data of the object.
+    :type xml_data: etree._Element
+    :param vl_id: The Visual Library ID of the object.
+    :type vl_id: str
+    :param metadata_sections_by_id: The metadata sections of the XML data indexed by their ID (see
+    MetsImporter.metadata_sections_by_id). If given, the object's metadata is looked up there instead of searching
+    the XML data.
+    :type metadata_sections_by_id: dict
+    """
+
     header = get_xml_header_from_vl_response(xml_data)
     type_from_header = get_object_type_from_xml_header(header)
 
     if type_from_header is not None:
         return type_from_header
 
-    metadata = xml_data.find(
-        Article.METS_TAG_SECTION_STRING,
-        {VisualLibraryExportElement.ID_STRING: "md{id}".format(id=vl_id)},
-    )
+    metadata_id = "md{vl_id}".format(vl_id=vl_id)
+    if metadata_sections_by_id:
+        metadata = metadata_sections_by_id.get(metadata_id)
+    else:
+        metadata = get_first_xpath_result(
+            MetsImporter.Section.METADATA_SECTION_BY_ID_XPATH,
+            xml_data,
+            metadata_id=metadata_id,
+        )
 
     if is_author_in_metadata(metadata) and has_pages(metadata):
         return Article
 
-    sections = xml_data.find_all(
-        VisualLibraryExportElement.METS_TAG_DIV_STRING,
-    )
-
-    if sections:
+    if xml_data.find(SECTION_PATH) is not None:
+        # The sections are iterated lazily, as the nesting deepness is usually found after a few sections
         nesting_deepness_of_corresponding_section = _get_nesting_deepness_for_section(
-            sections, vl_id
+            xml_data.iterfind(SECTION_PATH), vl_id
         )
         if nesting_deepness_of_corresponding_section == 1:
             return Journal
@@ -1091,38 +1275,37 @@ def get_object_type_from_xml(xml_data: Soup, vl_id: str):
     )
 
 
-def subsections_have_resource_pointer(metdata: Soup, vl_id: str):
-    own_section = metdata.find(attrs={"id": "log{}".format(vl_id)})
-    subsections = own_section.find_all(VisualLibraryExportElement.METS_TAG_DIV_STRING)
-    #attrs=MetsImporter.ATTRIBUTE_FILTER_FOR_SECTIONS)
-
-    return any(
-        section.find(VisualLibraryExportElement.METS_TAG_RESOURCE_POINTER_STRING)
-        is not None
-        for section in subsections
+def subsections_have_resource_pointer(metdata: etree._Element, vl_id: str):
+    own_section = get_first_xpath_result(
+        MetsImporter.ELEMENT_BY_ID_XPATH,
+        metdata,
+        element_id="log{vl_id}".format(vl_id=vl_id),
     )
+    # A single walk for any resource pointer nested in one of the subsections
+    return own_section.find(SUBSECTION_RESOURCE_POINTER_PATH) is not None
 
 
-def has_pages(metadata: Soup):
-    return (
-        metadata.find(
-            Article.MODS_TAG_EXTEND_STRING, {Article.UNIT_STRING: Article.PAGE_STRING}
-        )
-        is not None
-    )
+def has_pages(metadata: etree._Element):
+    return metadata.find(Article.PAGE_EXTENT_PATH) is not None
 
 
-def _get_nesting_deepness_for_section(sections: list, id_search_string: str) -> int:
+def _get_nesting_deepness_for_section(sections, id_search_string: str) -> int:
+    """Counts the sections in document order up to the one matching the ID search string or up to the first sibling.
+    :param sections: The METS divisions in document order.
+    :type sections: Iterable[etree._Element]
+    :rtype: int
+    """
+
     nesting_deepness_of_corresponding_section = 0
     last_parent = None
     for section in sections:
         nesting_deepness_of_corresponding_section += 1
         if (
             id_search_string in section.get(VisualLibraryExportElement.ID_STRING)
-            or last_parent == section.parent
+            or last_parent == section.getparent()
         ):
             break
-        last_parent = section.parent
+        last_parent = section.getparent()
 
     return nesting_deepness_of_corresponding_section
 
@@ -1136,8 +1319,7 @@ class VisualLibrary:
     HTML_ELEMENT_LINK = "a"
     IDENTIFIER_STRING = "identifier"
     METS_STRING = "mets"
-    REQUEST_TAG_STRING = "request"
-    SOUP_XML_ENCODING = "lxml"
+    REQUEST_TAG_STRING = "{*}request"
     TITLE_CONTENT_ELEMENT_ID = "tab-content-titleinfo"
     TITLE_INFO_ELEMENT_ID = "tab-periodical-titleinfo"
     VISUAL_LIBRARY_BASE_URL = "https://sammlungen.ub.uni-frankfurt.de"
@@ -1148,26 +1330,22 @@ class VisualLibrary:
     )
     VL_OBJECT_TYPES = VL_OBJECT_TYPES
 
+    def __init__(self):
+        self._elements_by_id = {}
+
     def get_data_for_id(self, vl_id, xml_response_format=METS_STRING):
         """Get the OAI XML data from the Visual Library.
         :param vl_id: The VL ID of the object to call the metadata for.
         :type vl_id: str
         :param xml_response_format: The format of the OAI XML response.
         :type xml_response_format: str
-        :returns: The response OAI XML in a BeautifulSoup element.
-        :rtype: BeautifulSoup
+        :returns: The response OAI XML as lxml element.
+        :rtype: lxml.etree._Element
         Mets is the default return format. There is no implementation of other formats currently! The received
         OAI XML data is stored.
         """
 
-        xml_importer = MetsImporter()
-        xml_importer.parse_xml_from_url(
-            self.VISUAL_LIBRARY_OAI_URL.format(
-                identifier=vl_id, xml_response_format=xml_response_format
-            )
-        )
-
-        return xml_importer.xml_data
+        return self._get_importer_for_id(vl_id, xml_response_format).xml_data
 
     def get_element_for_id(self, vl_id):
         """Returns an object containing the relevant metadata as attributes.
@@ -1175,11 +1353,18 @@ class VisualLibrary:
         :type vl_id: str
         :rtype VisualLibraryExportElement
         :returns: An object containing Visual Library metadata. None, if the element could not be found.
+
+        Elements are only called once per VisualLibrary instance. Further calls return the same object.
         """
 
-        logger.info("Creating new VL element")
-        xml_data = self.get_data_for_id(vl_id)
-        return self._create_vl_export_object(vl_id, xml_data)
+        if vl_id not in self._elements_by_id:
+            logger.info("Creating new VL element")
+            xml_importer = self._get_importer_for_id(vl_id)
+            self._elements_by_id[vl_id] = self._create_vl_export_object(
+                vl_id, xml_importer
+            )
+
+        return self._elements_by_id[vl_id]
 
     def get_element_from_url(self, vl_id, url):
         """Calls the OAI XML data from a given URL.
@@ -1187,14 +1372,14 @@ class VisualLibrary:
         :type vl_id: str
         :param url: The URL to call for the metadata.
         :type url: str
-        :returns: The response OAI XML in a BeautifulSoup element.
-        :rtype: BeautifulSoup
+        :returns: The response OAI XML as lxml element.
+        :rtype: lxml.etree._Element
         """
 
         xml_importer = MetsImporter()
         xml_importer.parse_xml_from_url(url)
 
-        return self._create_vl_export_object(vl_id, xml_importer.xml_data)
+        return self._create_vl_export_object(vl_id, xml_importer)
 
     def get_element_from_xml_file(self, xml_file_path_string):
         """Reads a given XML file and converts it's content to a VisualLibraryExport object.
@@ -1206,17 +1391,20 @@ class VisualLibrary:
         The XML file has to contain a local copy of a Visual Library response!
         """
 
-        with open(xml_file_path_string) as xml_file:
-            xml_data_string = xml_file.read()
+        # lxml decodes the raw bytes according to the XML declaration
+        with open(xml_file_path_string, "rb") as xml_file:
+            xml_data = get_xml_tree_from_string(xml_file.read())
 
-        xml_data = Soup(xml_data_string, self.SOUP_XML_ENCODING)
-        request_element = xml_data.find(self.REQUEST_TAG_STRING)
+        request_element = xml_data.find(".//" + self.REQUEST_TAG_STRING)
         if request_element is None:
             raise ValueError('A "request" tag was expected and not found!')
 
-        vl_id = request_element[self.IDENTIFIER_STRING]
+        vl_id = request_element.get(self.IDENTIFIER_STRING)
+
+        xml_importer = MetsImporter()
+        xml_importer.parse_xml(xml_data)
 
-        return self._create_vl_export_object(vl_id, xml_data)
+        return self._create_vl_export_object(vl_id, xml_importer)
 
     def get_page_by_id(self, page_id, partent_article_id=None):
         """Returns a single Page object.
@@ -1241,9 +1429,11 @@ class VisualLibrary:
             title_info_element = html_importer.get_element_by_id(
                 [self.TITLE_INFO_ELEMENT_ID, self.TITLE_CONTENT_ELEMENT_ID]
             )
-            title_info_link_element = title_info_element.find(self.HTML_ELEMENT_LINK)
+            title_info_link_element = title_info_element.find(
+                ".//" + self.HTML_ELEMENT_LINK
+            )
             title_vl_id = re.search(
-                r"[0-9]+$", title_info_link_element[self.HREF_STRING]
+                r"[0-9]+$", title_info_link_element.get(self.HREF_STRING)
             )
 
             title_vl_object = self.get_element_for_id(title_vl_id.group())
@@ -1254,13 +1444,9 @@ class VisualLibrary:
             )
 
             article_id = re.sub("^log", "", article_section_containing_page.id)
-            article_object_containing_page = VisualLibrary().get_element_for_id(
-                article_id
-            )
+            article_object_containing_page = self.get_element_for_id(article_id)
         else:
-            article_object_containing_page = VisualLibrary().get_element_for_id(
-                partent_article_id
-            )
+            article_object_containing_page = self.get_element_for_id(partent_article_id)
 
         for page in article_object_containing_page.pages:
             if page.vl_id == page_id:
@@ -1269,12 +1455,26 @@ class VisualLibrary:
         return None
 
     def _create_vl_export_object(
-        self, vl_id: str, xml_data: Soup
+        self, vl_id: str, xml_importer: MetsImporter
     ) -> Optional[VisualLibraryExportElement]:
-        object_type = get_object_type_from_xml(xml_data, vl_id)
+        """Creates the appropriate element from the data of an importer that has already parsed the XML data."""
+
+        object_type = get_object_type_from_xml(
+            xml_importer.xml_data, vl_id, xml_importer.metadata_sections_by_id
+        )
         if object_type is not None:
-            xml_importer = MetsImporter()
-            xml_importer.parse_xml(xml_data)
             return object_type(vl_id, xml_importer, parent=None)
         else:
             return None
+
+    def _get_importer_for_id(
+        self, vl_id: str, xml_response_format: str = METS_STRING
+    ) -> MetsImporter:
+        xml_importer = MetsImporter()
+        xml_importer.parse_xml_from_url(
+            self.VISUAL_LIBRARY_OAI_URL.format(
+                identifier=vl_id, xml_response_format=xml_response_format
+            )
+        )
+
+        return xml_importer
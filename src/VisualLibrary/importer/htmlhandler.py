@@ -1,9 +1,59 @@
+from contextlib import contextmanager
+
 import requests
+from requests.adapters import HTTPAdapter
+
+CONNECTION_POOL_SIZE = 16
+# Without a timeout, a stalled connection would block the import forever
+REQUEST_TIMEOUT_IN_SECONDS = 30
+
+# A shared session keeps the connections to the Visual Library alive between requests
+session = requests.Session()
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=CONNECTION_POOL_SIZE, pool_maxsize=CONNECTION_POOL_SIZE
+    ),
+)
+session.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=CONNECTION_POOL_SIZE, pool_maxsize=CONNECTION_POOL_SIZE
+    ),
+)
 
 
 def get_content_from_url(url, parameters=None):
     if parameters is None:
         parameters = {}
 
-    res = requests.get(url, params=parameters)
+    res = session.get(url, params=parameters, timeout=REQUEST_TIMEOUT_IN_SECONDS)
     return res.content
+
+
+@contextmanager
+def get_content_stream_from_url(url, parameters=None):
+    """Yields the streamed response, whose raw body is decoded while it is read.
+    The response is closed on exit, so its connection is returned to the pool even if reading fails.
+    """
+
+    if parameters is None:
+        parameters = {}
+
+    with session.get(
+        url, params=parameters, stream=True, timeout=REQUEST_TIMEOUT_IN_SECONDS
+    ) as res:
+        res.raw.decode_content = True
+        yield res
+
+
+def iter_content_from_url(url, chunk_size, parameters=None):
+    """Yields the (decoded) response body in chunks while it is downloaded."""
+
+    if parameters is None:
+        parameters = {}
+
+    with session.get(
+        url, params=parameters, stream=True, timeout=REQUEST_TIMEOUT_IN_SECONDS
+    ) as res:
+        yield from res.iter_content(chunk_size)
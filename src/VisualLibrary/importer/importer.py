@@ -1,24 +1,197 @@
-import base64
+import binascii
 import logging
+import re
+import string
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
-from bs4 import BeautifulSoup as Soup
+from lxml import etree, html
 
-from VisualLibrary.importer.htmlhandler import get_content_from_url
+from VisualLibrary.importer.htmlhandler import (
+    get_content_from_url,
+    get_content_stream_from_url,
+    iter_content_from_url,
+)
 
 logger = logging.getLogger("Import")
+ASCII_ENCODING_STRING = "ascii"
 BASE64_ENCODING_STRING = "base64"
+# A multiple of 3 bytes is encoded to base64 without padding, so encoded chunks can be concatenated
+BASE64_CHUNK_SIZE = 57 * 1024
 UTF8_ENCODING_STRING = "utf-8"
 DEBUG_FILE_DATA_CONTENT_BYTE_STRING = b"Here could be your PDF file!"
+METS_TIMESTAMP_FORMAT_STRING = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+try:
+    # The optional pybase64 package encodes with SIMD instructions and returns str directly
+    from pybase64 import b64encode_as_string
+except ImportError:
+
+    def b64encode_as_string(data) -> str:
+        """Encodes bytes-like data to a base64 string."""
+
+        # base64.b64encode only wraps this call. Base64 output is pure ASCII
+        return binascii.b2a_base64(data, newline=False).decode(ASCII_ENCODING_STRING)
+
+
+NAMESPACES = {
+    "dv": "http://dfg-viewer.de/",
+    "mets": "http://www.loc.gov/METS/",
+    "mods": "http://www.loc.gov/mods/v3",
+    "vl": "http://visuallibrary.net/vl",
+    "xlink": "http://www.w3.org/1999/xlink",
+    "xsi": "http://www.w3.org/2001/XMLSchema-instance",
+}
+UNESCAPED_AMPERSAND_PATTERN = re.compile(rb"&(?!#?\w+;)")
+
+
+def get_qualified_name(name: str) -> str:
+    """Returns a prefixed XML name (e.g. "mods:title") in lxml's Clark notation (e.g. "{namespace}title").
+    Names without a known namespace prefix are returned unchanged.
+    """
+
+    prefix, _, local_name = name.rpartition(":")
+    namespace = NAMESPACES.get(prefix)
+    if namespace is None:
+        return name
+
+    return "{{{namespace}}}{name}".format(namespace=namespace, name=local_name)
+
+
+XLINK_HREF_STRING = get_qualified_name("xlink:href")
+
+
+def get_first_xpath_result(xpath: etree.XPath, element, **variables):
+    """Returns the first result of a precompiled XPath expression or None, if there is no result."""
+
+    results = xpath(element, **variables)
+    return results[0] if results else None
+
+
+@lru_cache(maxsize=1024)
+def get_datetime_from_mets_timestamp(timestamp: str) -> datetime:
+    """Parses a METS timestamp like "2018-05-09T06:01:06.953500Z".
+    The fixed layout is sliced directly, which is considerably faster than datetime.strptime. Timestamps deviating
+    from the layout are handed to strptime, which raises a ValueError for invalid data.
+    The files of a METS document often share their timestamps, so the (immutable) results are cached.
+    :param timestamp: The timestamp string from a METS attribute.
+    :type timestamp: str
+    :rtype: datetime
+    """
+
+    try:
+        if (
+            timestamp[4] == "-"
+            and timestamp[7] == "-"
+            and timestamp[10] == "T"
+            and timestamp[13] == ":"
+            and timestamp[16] == ":"
+            and timestamp[19] == "."
+            and timestamp[-1] == "Z"
+            and (
+                timestamp[0:4]
+                + timestamp[5:7]
+                + timestamp[8:10]
+                + timestamp[11:13]
+                + timestamp[14:16]
+                + timestamp[17:19]
+            ).isdigit()
+        ):
+            fraction = timestamp[20:-1]
+            if 0 < len(fraction) <= 6 and fraction.isdigit():
+                return datetime(
+                    int(timestamp[0:4]),
+                    int(timestamp[5:7]),
+                    int(timestamp[8:10]),
+                    int(timestamp[11:13]),
+                    int(timestamp[14:16]),
+                    int(timestamp[17:19]),
+                    int(fraction.ljust(6, "0")),
+                )
+    except (IndexError, ValueError):
+        pass
+
+    return datetime.strptime(timestamp, METS_TIMESTAMP_FORMAT_STRING)
+
+
+def get_interned_string(value: Optional[str]) -> Optional[str]:
+    """Interns small, frequently repeated attribute values (e.g. mime types), so that equal values share one object."""
+
+    return sys.intern(value) if value else value
+
+
+def get_element_text(element) -> str:
+    """Returns the text of an XML element including the text of all its descendants."""
+
+    return "".join(element.itertext())
+
+
+def get_xml_parser(recover: bool = False) -> etree.XMLParser:
+    """Returns a parser for (possibly very large) METS documents.
+    The parser lifts libxml2's size limits and skips the ID hash table, which is never used for lookups.
+    The indentation between elements is dropped while parsing, as it is never read, and entities are not resolved.
+    A new parser is created per call, as lxml parsers must not be shared between threads.
+    """
+
+    return etree.XMLParser(
+        huge_tree=True,
+        collect_ids=False,
+        remove_blank_text=True,
+        resolve_entities=False,
+        recover=recover,
+    )
+
+
+def get_xml_tree_from_string(xml):
+    """Parses XML data into an lxml element tree.
+    :param xml: The XML data to parse.
+    :type xml: str or bytes
+    :returns: The root element of the parsed data.
+    :rtype: etree._Element
+
+    Local copies of Visual Library responses often lack the namespace declarations and escaped ampersands. Such
+    data is parsed in recovery mode and the known namespace prefixes are resolved afterwards.
+    """
+
+    if isinstance(xml, str):
+        xml = xml.encode(UTF8_ENCODING_STRING)
+
+    try:
+        return etree.fromstring(xml, get_xml_parser())
+    except etree.XMLSyntaxError:
+        # Unescaped ampersands (e.g. in OAI URLs) would be dropped by the recovering parser
+        xml = UNESCAPED_AMPERSAND_PATTERN.sub(b"&amp;", xml)
+        xml_tree = etree.fromstring(xml, get_xml_parser(recover=True))
+
+    if xml_tree is None:
+        raise ImportError("The given data could not be parsed as XML!")
+
+    _resolve_undeclared_namespace_prefixes(xml_tree)
+    return xml_tree
+
+
+def _resolve_undeclared_namespace_prefixes(xml_tree):
+    for element in xml_tree.iter(etree.Element):
+        qualified_tag = get_qualified_name(element.tag)
+        if qualified_tag != element.tag:
+            element.tag = qualified_tag
+
+        for attribute_name in element.keys():
+            qualified_attribute_name = get_qualified_name(attribute_name)
+            if qualified_attribute_name != attribute_name:
+                element.set(
+                    qualified_attribute_name, element.attrib.pop(attribute_name)
+                )
 
 
 class XMLImporter(ABC):
     """An abstract class that provides a simple XML import interface."""
 
-    ID_STRING = "id"
-    XML_IMPORT_PARSER = "lxml"
+    ID_STRING = "ID"
 
     def __init__(self):
         self.xml_data = None
@@ -26,16 +199,16 @@ class XMLImporter(ABC):
     def parse_xml(self, xml):
         """Import XML data.
         :param xml: The XML data to import
-        :type xml: str or Soup
+        :type xml: str, bytes or etree._Element
         """
 
-        if isinstance(xml, Soup):
+        if isinstance(xml, etree._Element):
             self.xml_data = xml
-        elif isinstance(xml, str):
-            self.xml_data = Soup(xml, self.XML_IMPORT_PARSER)
+        elif isinstance(xml, (str, bytes)):
+            self.xml_data = self._get_xml_tree_from_string(xml)
         else:
             raise TypeError(
-                "The provided XML data has to be a string or a Soup object!"
+                "The provided XML data has to be a string or an lxml element!"
             )
 
         self.update_data()
@@ -47,7 +220,21 @@ class XMLImporter(ABC):
         """
 
         xml_data = get_content_from_url(url)
-        self.parse_xml(xml_data.decode())
+        self.parse_xml(xml_data)
+
+    def parse_xml_file(self, file_path):
+        """Import XML data from a local file.
+        :param file_path: The path to the XML file.
+        :type file_path: str or os.PathLike
+
+        The file is read as bytes, so the XML parser decodes it according to its XML declaration.
+        """
+
+        with open(file_path, "rb") as xml_file:
+            self.parse_xml(xml_file.read())
+
+    def _get_xml_tree_from_string(self, xml):
+        return get_xml_tree_from_string(xml)
 
     @abstractmethod
     def update_data(self):
@@ -58,30 +245,62 @@ class XMLImporter(ABC):
 class File:
     """A class holding all information on a file."""
 
-    ATTRIBUTE_MIMETYPE_STRING = "mimetype"
-    ATTRIBUTE_FILE_SIZE_STRING = "size"
+    ATTRIBUTE_MIMETYPE_STRING = "MIMETYPE"
+    ATTRIBUTE_FILE_SIZE_STRING = "SIZE"
     ATTRIBUTE_ID_STRING = XMLImporter.ID_STRING
-    ATTRIBUTE_CREATION_DATE_STRING = "created"
-    ATTRIBUTE_LOCATION_TYPE_STRING = "loctype"
-    ATTRIBUTE_LINK_STRING = "xlink:href"
+    ATTRIBUTE_CREATION_DATE_STRING = "CREATED"
+    ATTRIBUTE_LOCATION_TYPE_STRING = "LOCTYPE"
+    ATTRIBUTE_LINK_STRING = XLINK_HREF_STRING
 
-    METS_TAG_FILE_LOCATION_STRING = "mets:flocat"
+    METS_TAG_FILE_LOCATION_STRING = get_qualified_name("mets:FLocat")
+    FILE_LOCATION_PATH = ".//" + METS_TAG_FILE_LOCATION_STRING
 
     URL_STRING = "URL"
 
+    # An import creates a File object per file pointer, hence no instance dictionaries
+    __slots__ = (
+        "name",
+        "date_uploaded",
+        "date_modified",
+        "mime_type",
+        "languages",
+        "url",
+        "_data",
+        "_size",
+    )
+
     def __init__(self):
         self.name = None
         self.date_uploaded = None
         self.date_modified = None
         self.mime_type = None
         self.languages = None
-        self.data = None
         self.url = None
 
+        self._data = None
         self._size = 0
 
+    @property
+    def data(self) -> Optional[bytes]:
+        """The file content. It is downloaded from the file URL on first access."""
+
+        if self._data is None and self.url is not None:
+            self.download_file_data_from_source()
+
+        return self._data
+
+    @data.setter
+    def data(self, value: Optional[bytes]):
+        self._data = value
+
+    @property
+    def is_downloaded(self) -> bool:
+        """Whether the file content is loaded, so that accessing data does not download it."""
+
+        return self._data is not None
+
     def download_file_data_from_source(self):
-        self.data = get_content_from_url(self.url)
+        self._data = get_content_from_url(self.url)
 
     def get_data_in_base64_encoding(self):
         """Transforms the data property into a base64-encoded string.
@@ -89,11 +308,41 @@ class File:
         :rtype: str
         """
 
-        if self.data is None:
-            self.download_file_data_from_source()
+        return b64encode_as_string(self.data)
+
+    def iter_data_in_base64_encoding(self, chunk_size=BASE64_CHUNK_SIZE):
+        """Yields the data property base64-encoded in chunks.
+        :param chunk_size: The number of data bytes encoded per chunk. Has to be a multiple of 3.
+        :type chunk_size: int
+        :returns: A generator of base64-encoded strings. Concatenated, they equal get_data_in_base64_encoding().
+        :rtype: generator
+
+        This avoids holding a complete base64 copy of large files in memory. If the data has not been downloaded yet,
+        it is streamed from the file URL and encoded while downloading, without keeping the data.
+        """
+
+        if chunk_size % 3 != 0:
+            raise ValueError("The chunk size has to be a multiple of 3!")
 
-        encoded_bytes = base64.b64encode(self.data)
-        return str(encoded_bytes, UTF8_ENCODING_STRING)
+        if self._data is None and self.url is not None:
+            yield from self._iter_streamed_data_in_base64_encoding(chunk_size)
+            return
+
+        data = memoryview(self.data)
+        for chunk_start in range(0, len(data), chunk_size):
+            yield b64encode_as_string(data[chunk_start : chunk_start + chunk_size])
+
+    def _iter_streamed_data_in_base64_encoding(self, chunk_size):
+        buffer = bytearray()
+        for downloaded_chunk in iter_content_from_url(self.url, chunk_size):
+            buffer += downloaded_chunk
+            # Only complete chunks are encoded, so no padding ends up in the middle of the output
+            while len(buffer) >= chunk_size:
+                yield b64encode_as_string(buffer[:chunk_size])
+                del buffer[:chunk_size]
+
+        if buffer:
+            yield b64encode_as_string(buffer)
 
     @property
     def size(self):
@@ -107,10 +356,12 @@ class File:
     def parse_properties_from_xml_element(self, xml_element):
         """Reads data from XML to set the file data.
         :param xml_element: An XML element (METS) containing the file data.
-        :type xml_element: BeautifulSoup
+        :type xml_element: etree._Element
         """
 
-        self.mime_type = xml_element.get(self.ATTRIBUTE_MIMETYPE_STRING)
+        self.mime_type = get_interned_string(
+            xml_element.get(self.ATTRIBUTE_MIMETYPE_STRING)
+        )
         self.size = xml_element.get(self.ATTRIBUTE_FILE_SIZE_STRING)
 
         name = xml_element.get(self.ATTRIBUTE_ID_STRING)
@@ -119,11 +370,11 @@ class File:
 
         date = xml_element.get(self.ATTRIBUTE_CREATION_DATE_STRING)
         if date is not None:
-            self.date_uploaded = self.date_modified = datetime.strptime(
-                date, "%Y-%m-%dT%H:%M:%S.%fZ"
+            self.date_uploaded = self.date_modified = get_datetime_from_mets_timestamp(
+                date
             )
 
-        file_locations = xml_element.find_all(self.METS_TAG_FILE_LOCATION_STRING)
+        file_locations = xml_element.iterfind(self.FILE_LOCATION_PATH)
         for location in file_locations:
             location_type = location.get(self.ATTRIBUTE_LOCATION_TYPE_STRING)
             if location_type == self.URL_STRING:
@@ -142,6 +393,7 @@ class HtmlImporter(XMLImporter):
     """A class for importing HTML pages."""
 
     HTML_ELEMENT_LINK_STRING = "a"
+    ID_STRING = "id"
     NAVIGATION_ELEMENT_ID = "navPath"
 
     def get_element_by_id(self, element_id):
@@ -149,14 +401,22 @@ class HtmlImporter(XMLImporter):
         :param element_id: The ID of an element or a list of elements on the page (in the XML data).
         :type element_id: str or list
         :returns: The first element having this ID. None, otherwise.
-        :rtype: BeautifulSoup or None
+        :rtype: etree._Element or None
         """
 
-        return self.xml_data.find(attrs={self.ID_STRING: element_id})
+        element_ids = [element_id] if isinstance(element_id, str) else element_id
+        for element in self.xml_data.iter(etree.Element):
+            if element.get(self.ID_STRING) in element_ids:
+                return element
+
+        return None
 
     def update_data(self):
         pass
 
+    def _get_xml_tree_from_string(self, xml):
+        return html.document_fromstring(xml)
+
     def get_navigation_hierarchy_labels(self):
         """Returns the labels of the navigation of the current HTML.
         :returns: A list of labels in hierarchical order. The list if empty, if none could be found
@@ -167,10 +427,8 @@ class HtmlImporter(XMLImporter):
 
         labels = []
         if navigation_element is not None:
-            hierarchy_elements = navigation_element.find_all(
-                self.HTML_ELEMENT_LINK_STRING
-            )
-            labels = [element.text for element in hierarchy_elements]
+            hierarchy_elements = navigation_element.iter(self.HTML_ELEMENT_LINK_STRING)
+            labels = [get_element_text(element) for element in hierarchy_elements]
 
         return labels
 
@@ -179,59 +437,110 @@ class MetsImporter(XMLImporter):
     """A class for importing METS data."""
 
     ATTRIBUTE_DOWNLOAD_STRING = "download"
-    ATTRIBUTE_FILE_ID_STRING = "fileid"
-    ATTRIBUTE_KEY_USE_STRING = "use"
+    ATTRIBUTE_FILE_ID_STRING = "FILEID"
+    ATTRIBUTE_KEY_USE_STRING = "USE"
 
-    METS_TAG_OBJECT_STRUCTURE_STRING = "mets:structmap"
-    METS_TAG_DIV_STRING = "mets:div"
-    METS_TAG_FILE_GROUP_STRING = "mets:filegrp"
-    METS_TAG_FILE_STRING = "mets:file"
+    METS_TAG_OBJECT_STRUCTURE_STRING = get_qualified_name("mets:structMap")
+    METS_TAG_DIV_STRING = get_qualified_name("mets:div")
+    METS_TAG_FILE_GROUP_STRING = get_qualified_name("mets:fileGrp")
+    METS_TAG_FILE_STRING = get_qualified_name("mets:file")
 
     SECTION_ID_PREFIX_STRING = "log"
     LOGICAL_STRING = "LOGICAL"
-    TYPE_STRING = "type"
+    TYPE_STRING = "TYPE"
+
+    MAX_DOWNLOAD_WORKERS = 8
+
+    # Some METS producers do not write the USE value in upper case (e.g. "Download")
+    DOWNLOAD_FILE_GROUP_XPATH = etree.XPath(
+        ".//mets:fileGrp[translate(@{use}, '{lower}', '{upper}')='{download}']".format(
+            use=ATTRIBUTE_KEY_USE_STRING,
+            lower=string.ascii_lowercase,
+            upper=string.ascii_uppercase,
+            download=ATTRIBUTE_DOWNLOAD_STRING.upper(),
+        ),
+        namespaces=NAMESPACES,
+    )
+    ELEMENT_BY_ID_XPATH = etree.XPath(
+        ".//*[@{id}=$element_id]".format(id=XMLImporter.ID_STRING)
+    )
+    FILE_GROUP_XPATH = etree.XPath(".//mets:fileGrp", namespaces=NAMESPACES)
+    LOGICAL_STRUCTURE_MAP_XPATH = etree.XPath(
+        ".//mets:structMap[@{type}='{logical}']".format(
+            type=TYPE_STRING, logical=LOGICAL_STRING
+        ),
+        namespaces=NAMESPACES,
+    )
+
+    def __init__(self, debug=False, parallel_downloads=False):
+        """
+        :param debug: If True, no file data is downloaded. A placeholder is used instead.
+        :type debug: bool
+        :param parallel_downloads: If True, the data of all downloadable files is fetched concurrently while
+        importing. Otherwise, the file data is downloaded on demand.
+        :type parallel_downloads: bool
+        """
 
-    def __init__(self, debug=False):
         super().__init__()
         self.structure = []
+        self.metadata_sections_by_id = {}
         self.debug_mode = debug
+        self.parallel_downloads = parallel_downloads
+
+    def parse_xml_from_url(self, url):
+        """Parse XML data from a given URL while it is downloaded.
+        :param url: A URL where to fetch the METS XML data.
+        :type url: str
+
+        The tree is built from the response stream, so the raw response is never held in memory next to the tree.
+        Responses that are not well-formed XML are rare; they are downloaded again and parsed in recovery mode.
+        """
+
+        try:
+            with get_content_stream_from_url(url) as response:
+                xml_data = etree.parse(response.raw, get_xml_parser()).getroot()
+        except etree.XMLSyntaxError:
+            xml_data = get_content_from_url(url)
+
+        self.parse_xml(xml_data)
 
     def get_section_by_id(self, section_id):
         prefixed_section_id = f"{self.SECTION_ID_PREFIX_STRING}{section_id}"
 
-        def search_section(section):
-            relevant_section = None
-            for sec in section:
-                if sec.id == prefixed_section_id:
-                    return sec
-
-                relevant_section = search_section(sec.sections)
-                if relevant_section is not None:
-                    break
+        for section in self.structure:
+            if section.id == prefixed_section_id:
+                return section
 
-            return relevant_section
+            # Every section holds all of its nested sections, so no recursion is needed
+            for nested_section in section.sections:
+                if nested_section.id == prefixed_section_id:
+                    return nested_section
 
-        return search_section(self.structure)
+        return None
 
     def update_data(self):
         """Reads the structure of the given METS object recursively."""
 
-        mets_structure = self.xml_data.find(
-            self.METS_TAG_OBJECT_STRUCTURE_STRING,
-            {self.TYPE_STRING: self.LOGICAL_STRING},
+        mets_structure = get_first_xpath_result(
+            self.LOGICAL_STRUCTURE_MAP_XPATH, self.xml_data
         )
 
         if mets_structure is None:
             raise ImportError(
                 "The given URL or ID (given: ) did not return METS-XML or could not find the searched data!\n"
-                "XML Response:\n{xml_data}".format(xml_data=self.xml_data)
+                "XML Response:\n{xml_data}".format(
+                    xml_data=etree.tostring(self.xml_data, encoding="unicode")
+                )
             )
 
-        subsections = mets_structure.find_all(
-            name=self.METS_TAG_DIV_STRING,
-            recursive=False,
+        self.metadata_sections_by_id = self.Section.get_metadata_sections_by_id(
+            self.xml_data
         )
-        self.structure = [self.Section(sec, self.xml_data) for sec in subsections]
+        subsections = mets_structure.iterchildren(self.METS_TAG_DIV_STRING)
+        self.structure = [
+            self.Section(sec, self.xml_data, self.metadata_sections_by_id)
+            for sec in subsections
+        ]
 
         self._resolve_mets_internal_id_references_for_section()
 
@@ -241,17 +550,17 @@ class MetsImporter(XMLImporter):
         """Returns a file object representing the given resource data."""
 
         if mets_file_group_section is None:
-            mets_file_group_download = self.xml_data.find(
-                self.METS_TAG_FILE_GROUP_STRING
+            mets_file_group_download = get_first_xpath_result(
+                self.FILE_GROUP_XPATH, self.xml_data
             )
 
             if mets_file_group_download is None:
                 return None
 
-        logger.debug("Processing file pointer: {}".format(resource_pointer_data))
+        logger.debug("Processing file pointer: %s", resource_pointer_data)
         file_tag_id = resource_pointer_data.get(self.ATTRIBUTE_FILE_ID_STRING)
-        file_metadata = mets_file_group_download.find(
-            attrs={self.ID_STRING: file_tag_id}
+        file_metadata = get_first_xpath_result(
+            self.ELEMENT_BY_ID_XPATH, mets_file_group_download, element_id=file_tag_id
         )
         if file_metadata is not None:
             return self._get_file_from_metadata(file_metadata)
@@ -261,7 +570,7 @@ class MetsImporter(XMLImporter):
     def _get_file_from_metadata(self, mets_data):
         """Creates a file object and adds data as far as possible.
         :param mets_data: The metadata to read the file data from.
-        :type mets_data: Soup
+        :type mets_data: etree._Element
         :rtype: File
         """
 
@@ -278,100 +587,248 @@ class MetsImporter(XMLImporter):
         This function only searches for the file group tag that has the USE=DOWNLOAD attribute.
         """
 
-        file_group_attributes = {
-            self.ATTRIBUTE_KEY_USE_STRING: self.ATTRIBUTE_DOWNLOAD_STRING.upper()
-        }
-        mets_file_group_download = self.xml_data.find(
-            self.METS_TAG_FILE_GROUP_STRING, file_group_attributes
+        mets_file_group_download = get_first_xpath_result(
+            self.DOWNLOAD_FILE_GROUP_XPATH, self.xml_data
         )
+        if mets_file_group_download is None:
+            return
+
+        # Index the files once instead of searching the file group for every file pointer
+        files_by_id = {}
+        for file_element in mets_file_group_download.iterdescendants(etree.Element):
+            file_id = file_element.get(self.ID_STRING)
+            if file_id is not None:
+                files_by_id.setdefault(file_id, file_element)
+
+        resolved_files = []
 
         def resolve_file_pointers(sec):
             for file_pointer_data in sec.file_pointers_data:
-                logger.debug("Processing file pointer: {}".format(file_pointer_data))
+                # Lazy formatting, as this is called for every file pointer
+                logger.debug("Processing file pointer: %s", file_pointer_data)
                 file_tag_id = file_pointer_data.get(self.ATTRIBUTE_FILE_ID_STRING)
-                file_metdata = mets_file_group_download.find(
-                    attrs={self.ID_STRING: file_tag_id}
-                )
+                file_metdata = files_by_id.get(file_tag_id)
                 if file_metdata is not None:
                     file = self._get_file_from_metadata(file_metdata)
                     file.languages = section.languages
-                    sec.files.add(file)
+                    sec.files.append(file)
+                    resolved_files.append(file)
                 else:
                     logger.debug(
-                        'No file node found with id "{}". Skipping!'.format(file_tag_id)
+                        'No file node found with id "%s". Skipping!', file_tag_id
                     )
 
-            for child in sec.sections:
-                resolve_file_pointers(child)
+        for section in self.structure:
+            # Nested sections are shared between the section lists of all their ancestors,
+            # hence every section is resolved only once
+            resolve_file_pointers(section)
+            for nested_section in section.sections:
+                resolve_file_pointers(nested_section)
+
+        if self.parallel_downloads and not self.debug_mode:
+            self._download_files(resolved_files)
+
+    def download_all_files(self, max_workers: int = None):
+        """Downloads the data of all files of the imported structure concurrently.
+        Files whose data is already available are skipped.
+        :param max_workers: The number of concurrent downloads. Defaults to MAX_DOWNLOAD_WORKERS.
+        :type max_workers: int
+        """
+
+        files = []
+        for section in self.structure:
+            files.extend(section.files)
+            # Every section holds all of its nested sections
+            for nested_section in section.sections:
+                files.extend(nested_section.files)
+
+        self._download_files(files, max_workers)
+
+    def _download_files(self, files: list, max_workers: int = None):
+        """Downloads the data of all given files concurrently."""
+
+        if max_workers is None:
+            max_workers = self.MAX_DOWNLOAD_WORKERS
+
+        # Nested sections may hold their own File objects for the same URL
+        files_by_url = {}
+        for file in files:
+            if not file.is_downloaded and file.url is not None:
+                files_by_url.setdefault(file.url, []).append(file)
+
+        if not files_by_url:
+            return
 
-        if mets_file_group_download is not None:
-            for section in self.structure:
-                resolve_file_pointers(section)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            urls = list(files_by_url)
+            for url, data in zip(urls, executor.map(get_content_from_url, urls)):
+                for file in files_by_url[url]:
+                    file.data = data
 
     class Section:
         """A subdivision within a METS object."""
 
-        ATTRIBUTE_HREF = "xlink:href"
-        ATTRIBUTE_LABEL = "label"
-        ATTRIBUTE_LOCTYPE = "loctype"
-        ATTRIBUTE_METADATA_ID = "dmdid"
-        ATTRIBUTE_ORDER = "order"
+        ATTRIBUTE_HREF = XLINK_HREF_STRING
+        ATTRIBUTE_LABEL = "LABEL"
+        ATTRIBUTE_LOCTYPE = "LOCTYPE"
+        ATTRIBUTE_METADATA_ID = "DMDID"
+        ATTRIBUTE_ORDER = "ORDER"
 
-        METS_TAG_FILE_POINTER_STRING = "mets:fptr"
-        METS_TAG_RESOURCE_POINTER_STRING = "mets:mptr"
-        METS_TAG_METADATA_SECTION_STRING = "mets:dmdsec"
+        METS_TAG_FILE_POINTER_STRING = get_qualified_name("mets:fptr")
+        METS_TAG_RESOURCE_POINTER_STRING = get_qualified_name("mets:mptr")
+        METS_TAG_METADATA_SECTION_STRING = get_qualified_name("mets:dmdSec")
 
-        MODS_TAG_LANGUAGE_LIST_STRING = "mods:language"
-        MODS_TAG_SPECIFIC_LANGUAGE_STRING = "mods:languageterm"
-        MODS_TAG_TITLE_INFO_STRING = "mods:titleinfo"
-        MODS_TAG_TITLE_STRING = "mods:title"
-        MODS_TAG_SUBTITLE_STRING = "mods:subtitle"
+        MODS_TAG_LANGUAGE_LIST_STRING = get_qualified_name("mods:language")
+        MODS_TAG_SPECIFIC_LANGUAGE_STRING = get_qualified_name("mods:languageTerm")
+        MODS_TAG_TITLE_INFO_STRING = get_qualified_name("mods:titleInfo")
+        MODS_TAG_TITLE_STRING = get_qualified_name("mods:title")
+        MODS_TAG_SUBTITLE_STRING = get_qualified_name("mods:subTitle")
+
+        LANGUAGE_LIST_PATH = ".//" + MODS_TAG_LANGUAGE_LIST_STRING
+        SPECIFIC_LANGUAGE_PATH = ".//" + MODS_TAG_SPECIFIC_LANGUAGE_STRING
 
         URL_STRING = "URL"
 
-        def __init__(self, mets_data: Soup, full_xml_data):
+        METADATA_SECTION_BY_ID_XPATH = etree.XPath(
+            ".//mets:dmdSec[@{id}=$metadata_id]".format(id=XMLImporter.ID_STRING),
+            namespaces=NAMESPACES,
+        )
+
+        # An import creates a Section object per METS division, hence no instance dictionaries
+        __slots__ = (
+            "id",
+            "metadata_id",
+            "label",
+            "order",
+            "metadata",
+            "files",
+            "file_pointers_data",
+            "resource_pointers",
+            "sections",
+            "_languages",
+        )
+
+        def __init__(
+            self,
+            mets_data: etree._Element,
+            full_xml_data,
+            metadata_sections_by_id: dict = None,
+        ):
+            if metadata_sections_by_id is None:
+                metadata_sections_by_id = self.get_metadata_sections_by_id(
+                    full_xml_data
+                )
+
+            self._read_section_data(mets_data, metadata_sections_by_id)
+            self._build_subsections(mets_data, metadata_sections_by_id)
+
+        @classmethod
+        def get_metadata_sections_by_id(cls, full_xml_data) -> dict:
+            """Indexes all metadata sections (dmdSec) of the given METS data by their ID.
+            :param full_xml_data: The complete METS data.
+            :type full_xml_data: etree._Element
+            :rtype: dict
+            """
+
+            metadata_sections_by_id = {}
+            for metadata_section in full_xml_data.iter(
+                cls.METS_TAG_METADATA_SECTION_STRING
+            ):
+                metadata_sections_by_id.setdefault(
+                    metadata_section.get(MetsImporter.ID_STRING), metadata_section
+                )
+
+            return metadata_sections_by_id
+
+        @classmethod
+        def _create_without_subsections(
+            cls, mets_data: etree._Element, metadata_sections_by_id: dict
+        ) -> "MetsImporter.Section":
+            section = cls.__new__(cls)
+            section._read_section_data(mets_data, metadata_sections_by_id)
+            return section
+
+        def _build_subsections(
+            self, mets_data: etree._Element, metadata_sections_by_id: dict
+        ):
+            """Creates the sections of all nested METS divisions.
+            Every section holds all of its descendant divisions (not only its children). Each division is read only
+            once: a nested section is a shared object within the section lists of all its ancestors.
+            """
+
+            sections_by_element = {mets_data: self}
+            for subsection_element in mets_data.iterdescendants(
+                MetsImporter.METS_TAG_DIV_STRING
+            ):
+                section = self._create_without_subsections(
+                    subsection_element, metadata_sections_by_id
+                )
+                sections_by_element[subsection_element] = section
+
+                # Document order keeps the section lists of all ancestors in document order as well
+                ancestor_element = subsection_element.getparent()
+                while ancestor_element is not None:
+                    ancestor_section = sections_by_element.get(ancestor_element)
+                    if ancestor_section is not None:
+                        ancestor_section.sections.append(section)
+                    if ancestor_element is mets_data:
+                        break
+                    ancestor_element = ancestor_element.getparent()
+
+        def _read_section_data(
+            self, mets_data: etree._Element, metadata_sections_by_id: dict
+        ):
             self.id = mets_data.get(MetsImporter.ID_STRING)
             self.metadata_id = mets_data.get(self.ATTRIBUTE_METADATA_ID)
             self.label = mets_data.get(self.ATTRIBUTE_LABEL)
-            self.order = mets_data.get(self.ATTRIBUTE_ORDER)
+            self.order = get_interned_string(mets_data.get(self.ATTRIBUTE_ORDER))
             self.metadata = None
-            self.languages = set()
-            self.files = set()
+            self.files = []
+            self._languages = None
 
-            self.file_pointers_data = mets_data.find_all(
-                self.METS_TAG_FILE_POINTER_STRING, recursive=False
+            self.file_pointers_data = list(
+                mets_data.iterchildren(self.METS_TAG_FILE_POINTER_STRING)
             )
-            self.resource_pointers = mets_data.find_all(
-                self.METS_TAG_RESOURCE_POINTER_STRING, recursive=False
+            self.resource_pointers = list(
+                mets_data.iterchildren(self.METS_TAG_RESOURCE_POINTER_STRING)
             )
 
-            subsections = mets_data.find_all(
-                name=MetsImporter.METS_TAG_DIV_STRING,
-                recursive=True,
-            )
-            self.sections = [
-                MetsImporter.Section(sec, full_xml_data) for sec in subsections
-            ]
+            self.sections = []
 
             if self.metadata_id:
-                self.extract_section_metadata_from_complete_dataset(full_xml_data)
-
-                language_list = self.metadata.find(self.MODS_TAG_LANGUAGE_LIST_STRING)
-                if language_list is not None:
-                    self.languages = set(
-                        lang.text
-                        for lang in language_list.find_all(
-                            self.MODS_TAG_SPECIFIC_LANGUAGE_STRING
-                        )
-                    )
+                self.metadata = metadata_sections_by_id.get(self.metadata_id)
+
+        @property
+        def languages(self) -> set:
+            """The languages of this section, read from its metadata on first access."""
+
+            if self._languages is None:
+                self._languages = self._extract_languages_from_metadata()
+
+            return self._languages
+
+        def _extract_languages_from_metadata(self) -> set:
+            if self.metadata is None:
+                return set()
+
+            language_list = self.metadata.find(self.LANGUAGE_LIST_PATH)
+            if language_list is None:
+                return set()
+
+            return set(
+                sys.intern(get_element_text(lang))
+                for lang in language_list.iterfind(self.SPECIFIC_LANGUAGE_PATH)
+            )
 
         def extract_section_metadata_from_complete_dataset(self, xml_metadata):
             """Gets the metadata for this section from the overall metadataset.
             :parameter xml_metadata: The overall metadata set
-            :type xml_metadata: Soup
+            :type xml_metadata: etree._Element
             """
 
-            self.metadata = xml_metadata.find(
-                name=self.METS_TAG_METADATA_SECTION_STRING,
-                attrs={MetsImporter.ID_STRING: self.metadata_id},
+            self.metadata = get_first_xpath_result(
+                self.METADATA_SECTION_BY_ID_XPATH,
+                xml_metadata,
+                metadata_id=self.metadata_id,
             )
+            self._languages = None
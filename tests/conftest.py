@@ -1,13 +1,53 @@
 import pathlib
+from functools import lru_cache
 
 import pytest
 
 from VisualLibrary import VisualLibrary
+from VisualLibrary.importer import htmlhandler
 from VisualLibrary.importer.importer import MetsImporter
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
-@pytest.fixture
+RESPONSE_CACHE_EXPIRATION_IN_SECONDS = 24 * 60 * 60
+
+
+def pytest_collection_modifyitems(items):
+    """Runs the tests that call the Visual Library server last.
+    Failures of the fast offline tests are reported first. The order within both groups is kept.
+    """
+
+    items.sort(key=lambda item: item.get_closest_marker("network") is not None)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cached_visual_library_responses(request):
+    """Caches the responses of the Visual Library server between test runs, if requests-cache is installed.
+    The cache is stored in pytest's cache directory.
+    """
+
+    pytest_cache = getattr(request.config, "cache", None)
+    if requests_cache is None or pytest_cache is None:
+        yield
+        return
+
+    cache_directory = pytest_cache.mkdir("visual-library-responses")
+    original_session = htmlhandler.session
+    htmlhandler.session = requests_cache.CachedSession(
+        str(cache_directory / "responses"),
+        backend="sqlite",
+        expire_after=RESPONSE_CACHE_EXPIRATION_IN_SECONDS,
+    )
+    yield
+    htmlhandler.session = original_session
+
+
+@pytest.fixture(scope="session")
 def visual_library():
+    # Shared, so elements fetched by one test are served from the instance cache in the others
     return VisualLibrary()
 
 
@@ -16,6 +56,21 @@ def mets_importer():
     return MetsImporter()
 
 
+@pytest.fixture(scope="session")
+def parsed_mets_importer():
+    """Returns a function that parses a METS file at most once per test session.
+    The returned importers are shared between tests and must not be modified.
+    """
+
+    @lru_cache(maxsize=None)
+    def get_parsed_mets_importer(file_path):
+        mets_importer = MetsImporter()
+        mets_importer.parse_xml_file(file_path)
+        return mets_importer
+
+    return get_parsed_mets_importer
+
+
 @pytest.fixture
 def test_data_directory():
     current_path = pathlib.Path(__file__).parent
@@ -1,6 +1,6 @@
 import pytest
 
-from VisualLibrary import Article
+from VisualLibrary import Article, Author, File
 
 
 class TestArticle:
@@ -9,14 +9,48 @@ class TestArticle:
         assert article.page_range.start == "248"
         assert article.page_range.end == "248"
 
+    @pytest.mark.parametrize("article", ["9738495"], indirect=True)
+    def test_article_authors(self, article: Article):
+        assert article.authors == [Author("Ernst", "Baier", "")]
+
+    @pytest.mark.parametrize("article", ["9738495"], indirect=True)
+    def test_lazy_metadata_can_be_overwritten(self, article: Article):
+        article.title = "A new title"
+        _ = article.subtitle
+
+        assert article.title == "A new title"
+        assert article.languages == ["ger"]
+
+    @pytest.mark.parametrize("article", ["9738495"], indirect=True)
+    def test_teaser_image_file_is_available_before_its_url(self, article: Article):
+        teaser_image_file = article.teaser_image_file
+
+        assert isinstance(teaser_image_file, File)
+        assert teaser_image_file.url == article.teaser_image_url
+
+    @pytest.mark.parametrize("article", ["9738495"], indirect=True)
+    def test_failing_metadata_extraction_raises_on_every_access(
+        self, article: Article, monkeypatch
+    ):
+        def fail_to_extract_titles():
+            raise ValueError("Broken title metadata")
+
+        monkeypatch.setattr(
+            article, "_extract_titles_from_metadata", fail_to_extract_titles
+        )
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                _ = article.title
+
     @pytest.fixture
-    def article(self, request, article_test_data_directory, mets_importer) -> Article:
+    def article(
+        self, request, article_test_data_directory, parsed_mets_importer
+    ) -> Article:
         article_id = request.param
         article_file_name = article_test_data_directory / f"article_{article_id}.xml"
 
-        with open(article_file_name, "r") as f:
-            file_content_string = f.read()
-
-        mets_importer.parse_xml(file_content_string)
+        # Each test gets its own Article, as tests may overwrite its metadata
+        mets_importer = parsed_mets_importer(article_file_name)
 
         return Article(vl_id=article_id, xml_importer=mets_importer, parent=None)
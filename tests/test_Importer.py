@@ -1,16 +1,29 @@
-import os
+import gzip
 import re
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import date, datetime
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from types import SimpleNamespace
 
+import pytest
+import requests
+from lxml import etree
+from requests.structures import CaseInsensitiveDict
+from urllib3 import HTTPResponse
+
+from VisualLibrary.importer import htmlhandler, importer
 from VisualLibrary.importer.importer import (
     DEBUG_FILE_DATA_CONTENT_BYTE_STRING,
     File,
     MetsImporter,
+    get_datetime_from_mets_timestamp,
 )
 
-CURRENT_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
-TEST_DATA_DIRECTORY = "{base_dir}/data/Importer".format(base_dir=CURRENT_DIRECTORY)
+TEST_DATA_DIRECTORY = Path(__file__).resolve().parent / "data" / "Importer"
+PDF_CREATION_DATE = date(2020, 6, 8)
+PDF_FILE_NAME_PATTERN = re.compile(r"pdf_\d+")
 
 
 class TestImporter:
@@ -20,7 +33,7 @@ class TestImporter:
         """
         mets_importer = MetsImporter(debug=True)
 
-        xml_data = get_oai_response_xml_string()
+        xml_data = get_oai_response_xml_data()
         mets_importer.parse_xml(xml_data)
 
         assert len(mets_importer.structure) == 1
@@ -34,8 +47,7 @@ class TestImporter:
         assert issue.metadata is not None
 
         articles = issue.sections
-        pdf_creation_date = datetime.fromisoformat("2020-06-08")
-        articles_with_files = [
+        articles_with_files = {
             "log10773126",
             "log10773134",
             "log10773142",
@@ -44,30 +56,176 @@ class TestImporter:
             "log10773164",
             "log10773171",
             "log10773178",
-        ]
+        }
 
         for article in articles:
             assert len(article.resource_pointers) >= 1
 
             if article.id in articles_with_files:
+                if article.files:
+                    assert article.metadata is not None
                 for f in article.files:
-                    assert f.date_uploaded.date() == pdf_creation_date.date()
-                    assert f.date_modified.date() == pdf_creation_date.date()
+                    assert f.date_uploaded.date() == PDF_CREATION_DATE
+                    assert f.date_modified.date() == PDF_CREATION_DATE
                     assert f.size > 0
                     assert f.mime_type == "application/pdf"
                     assert f.languages == {"ger"}
                     assert f.data == DEBUG_FILE_DATA_CONTENT_BYTE_STRING
-                    assert re.match(r"pdf_[0-9]*", f.name)
-                    assert article.metadata is not None
+                    assert PDF_FILE_NAME_PATTERN.match(f.name)
             else:
                 assert len(article.files) == 0
 
+    def test_mets_importer_from_url_recovers_malformed_response(self, monkeypatch):
+        streamed_urls = []
+        downloaded_urls = []
+        closed_responses = []
+        # A bare ampersand makes the response malformed, so it is parsed in recovery mode
+        response_data = get_oai_response_xml_data().replace(
+            b"</mods:title>", b" & more</mods:title>", 1
+        )
+
+        @contextmanager
+        def get_content_stream_from_url(url):
+            streamed_urls.append(url)
+            response = SimpleNamespace(raw=BytesIO(response_data))
+            try:
+                yield response
+            finally:
+                closed_responses.append(response)
+
+        def get_content_from_url(url):
+            downloaded_urls.append(url)
+            return response_data
+
+        monkeypatch.setattr(
+            importer, "get_content_stream_from_url", get_content_stream_from_url
+        )
+        monkeypatch.setattr(importer, "get_content_from_url", get_content_from_url)
+
+        mets_importer = MetsImporter(debug=True)
+        mets_importer.parse_xml_from_url("https://example.org/oai/10771471")
+
+        assert streamed_urls == ["https://example.org/oai/10771471"]
+        assert downloaded_urls == ["https://example.org/oai/10771471"]
+        assert len(closed_responses) == 1
+        assert len(mets_importer.structure) == 1
+        assert mets_importer.structure[0].sections
+
+    def test_content_stream_decodes_compressed_response(self, monkeypatch):
+        xml_data = (
+            b'<?xml version="1.0" encoding="UTF-8"?><root><child>text</child></root>'
+        )
+        raw_response = HTTPResponse(
+            body=BytesIO(gzip.compress(xml_data)),
+            headers={"Content-Encoding": "gzip"},
+            status=200,
+            preload_content=False,
+        )
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict(raw_response.headers)
+        response.raw = raw_response
+        response.url = "https://example.org/oai/10771471"
+
+        monkeypatch.setattr(
+            htmlhandler, "session", SimpleNamespace(get=lambda url, **kwargs: response)
+        )
+
+        with htmlhandler.get_content_stream_from_url(response.url) as streamed_response:
+            xml_tree = etree.parse(streamed_response.raw).getroot()
+
+        assert xml_tree.findtext("child") == "text"
+        assert raw_response.closed
+
+    def test_mets_importer_from_file(self):
+        mets_importer = MetsImporter(debug=True)
+        mets_importer.parse_xml_file(TEST_DATA_DIRECTORY / "volume-oai-response.xml")
+
+        assert len(mets_importer.structure) == 1
+        assert mets_importer.structure[0].sections
+
+    def test_nested_sections_are_shared(self):
+        mets_importer = MetsImporter(debug=True)
+        mets_importer.parse_xml(get_oai_response_xml_data())
+
+        journal = mets_importer.structure[0]
+        issue = journal.sections[0]
+
+        # Every section holds all of its nested sections in document order
+        assert journal.sections[1:] == issue.sections
+        assert len({id(section) for section in journal.sections}) == len(
+            journal.sections
+        )
+
+    def test_get_section_by_id(self):
+        mets_importer = MetsImporter(debug=True)
+        mets_importer.parse_xml(get_oai_response_xml_data())
+
+        assert mets_importer.get_section_by_id("10773126").id == "log10773126"
+        assert mets_importer.get_section_by_id("0") is None
+
+    def test_download_file_group_use_is_case_insensitive(self):
+        mets_importer = MetsImporter(debug=True)
+        mets_importer.parse_xml(
+            get_oai_response_xml_data().replace(b'USE="DOWNLOAD"', b'USE="Download"')
+        )
+
+        assert mets_importer.structure[0].sections[0].files
+
+    def test_mets_importer_with_parallel_downloads(self, monkeypatch):
+        downloaded_urls = []
+
+        def get_content_from_url(url):
+            downloaded_urls.append(url)
+            return url.encode()
+
+        monkeypatch.setattr(importer, "get_content_from_url", get_content_from_url)
+
+        mets_importer = MetsImporter(parallel_downloads=True)
+        mets_importer.parse_xml(get_oai_response_xml_data())
+
+        files = [
+            file
+            for article in mets_importer.structure[0].sections[0].sections
+            for file in article.files
+        ]
+        assert files
+        # Every URL is downloaded only once
+        assert len(downloaded_urls) == len(set(downloaded_urls))
+        for file in files:
+            assert file.data == file.url.encode()
+
+    def test_download_all_files(self, monkeypatch):
+        downloaded_urls = []
+
+        def get_content_from_url(url):
+            downloaded_urls.append(url)
+            return url.encode()
+
+        monkeypatch.setattr(importer, "get_content_from_url", get_content_from_url)
 
-def get_oai_response_xml_string():
-    oai_response_file_path = Path(TEST_DATA_DIRECTORY, "volume-oai-response.xml")
-    with open(str(oai_response_file_path), "r") as oai_response:
-        oai_response_string = oai_response.read()
-    return oai_response_string
+        mets_importer = MetsImporter()
+        mets_importer.parse_xml(get_oai_response_xml_data())
+        assert not downloaded_urls
+
+        mets_importer.download_all_files(max_workers=2)
+
+        files = [
+            file
+            for article in mets_importer.structure[0].sections[0].sections
+            for file in article.files
+        ]
+        assert files
+        assert len(downloaded_urls) == len(set(downloaded_urls))
+        for file in files:
+            assert file.data == file.url.encode()
+
+
+# The fixture is read by most importer tests, but only once per test session
+@lru_cache(maxsize=None)
+def get_oai_response_xml_data():
+    # lxml decodes the raw bytes itself
+    return (TEST_DATA_DIRECTORY / "volume-oai-response.xml").read_bytes()
 
 
 class TestFileClass:
@@ -79,3 +237,74 @@ class TestFileClass:
             base64_encoded_data_content
             == "VGhpcyBpcyBhIHRlc3QgcGRmIGZpbGUgY29udGVudC4="
         )
+
+    def test_file_data_base64_encoding_in_chunks(self):
+        file = File()
+        file.data = b"This is a test pdf file content."
+        base64_encoded_chunks = list(file.iter_data_in_base64_encoding(chunk_size=6))
+        assert len(base64_encoded_chunks) == 6
+        assert "".join(base64_encoded_chunks) == file.get_data_in_base64_encoding()
+
+    def test_file_data_base64_encoding_while_streaming(self, monkeypatch):
+        file_content = b"This is a test pdf file content."
+
+        def iter_content_from_url(url, chunk_size):
+            # Chunks of an uneven size, as delivered by the network
+            for chunk_start in range(0, len(file_content), 5):
+                yield file_content[chunk_start : chunk_start + 5]
+
+        monkeypatch.setattr(importer, "iter_content_from_url", iter_content_from_url)
+
+        file = File()
+        file.url = "https://example.org/download/pdf/1"
+        base64_encoded_chunks = list(file.iter_data_in_base64_encoding(chunk_size=6))
+        assert len(base64_encoded_chunks) == 6
+        assert all(len(chunk) == 8 for chunk in base64_encoded_chunks[:-1])
+        assert (
+            "".join(base64_encoded_chunks)
+            == "VGhpcyBpcyBhIHRlc3QgcGRmIGZpbGUgY29udGVudC4="
+        )
+        # The streamed data is not kept
+        assert not file.is_downloaded
+
+    def test_file_data_is_downloaded_on_first_access(self, monkeypatch):
+        downloaded_urls = []
+
+        def get_content_from_url(url):
+            downloaded_urls.append(url)
+            return b"This is a test pdf file content."
+
+        monkeypatch.setattr(importer, "get_content_from_url", get_content_from_url)
+
+        file = File()
+        file.url = "https://example.org/download/pdf/1"
+        assert not downloaded_urls
+        assert not file.is_downloaded
+        assert file.data == b"This is a test pdf file content."
+        assert file.is_downloaded
+        assert file.data == b"This is a test pdf file content."
+        assert downloaded_urls == ["https://example.org/download/pdf/1"]
+
+
+class TestTimestampParsing:
+    def test_mets_timestamp(self):
+        assert get_datetime_from_mets_timestamp(
+            "2018-05-09T06:01:06.953500Z"
+        ) == datetime(2018, 5, 9, 6, 1, 6, 953500)
+
+    def test_mets_timestamp_with_short_fraction(self):
+        assert get_datetime_from_mets_timestamp("2018-05-09T06:01:06.95Z") == datetime(
+            2018, 5, 9, 6, 1, 6, 950000
+        )
+
+    def test_invalid_mets_timestamp(self):
+        with pytest.raises(ValueError):
+            get_datetime_from_mets_timestamp("2018-05-09")
+
+    @pytest.mark.parametrize(
+        "timestamp",
+        ["2018-05-09T06x01x06.953500Z", "2018-05-09T 6:01: 6.953500Z"],
+    )
+    def test_mets_timestamp_with_bad_separator_or_field(self, timestamp):
+        with pytest.raises(ValueError):
+            get_datetime_from_mets_timestamp(timestamp)
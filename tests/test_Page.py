@@ -1,89 +1,111 @@
-import os
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
-from bs4 import BeautifulSoup as Soup
+import pytest
+from lxml import etree
 
 from VisualLibrary import File, Page
+from VisualLibrary.importer.importer import (
+    get_first_xpath_result,
+    get_xml_tree_from_string,
+)
 
 from .data.VisualLibrary import full_text_data
 
 IMAGE_MIME_TYPE = "image/jpeg"
+PAGE_BY_ID_XPATH = etree.XPath(".//*[@ID=$page_id][@TYPE='page']")
+TEST_DATA_FOLDER = Path(__file__).resolve().parent / "data" / "Page"
+
+
+@lru_cache(maxsize=None)
+def get_xml_tree_from_data_file(xml_file_name_in_data_folder):
+    # The raw bytes are handed to lxml, which decodes them itself
+    xml_data = (TEST_DATA_FOLDER / xml_file_name_in_data_folder).read_bytes()
+    return get_xml_tree_from_string(xml_data)
+
+
+@pytest.fixture(scope="module")
+def page():
+    return TestPage.get_new_page_with_data(
+        xml_file_name_in_data_folder="article-oai-response.xml",
+        page_id_in_data="phys9660761",
+    )
 
 
 class TestPage:
     @staticmethod
     def get_new_page_with_data(xml_file_name_in_data_folder, page_id_in_data):
-        this_files_directory = os.path.dirname(os.path.realpath(__file__))
-        xml_file_path_string = "{base_dir}/data/Page/{file_name}".format(
-            base_dir=this_files_directory, file_name=xml_file_name_in_data_folder
-        )
-        with open(xml_file_path_string, "r") as article_xml_file:
-            xml_data = article_xml_file.read()
-        xml_soup = Soup(xml_data, "lxml")
-        page_element_in_data = xml_soup.find(
-            attrs={"id": page_id_in_data, "type": "page"}
+        xml_tree = get_xml_tree_from_data_file(xml_file_name_in_data_folder)
+        page_element_in_data = get_first_xpath_result(
+            PAGE_BY_ID_XPATH, xml_tree, page_id=page_id_in_data
         )
 
-        return Page(page_element_in_data, xml_soup)
-
-    def test_page_instantiation(self):
-        page = TestPage.get_new_page_with_data(
-            xml_file_name_in_data_folder="article-oai-response.xml",
-            page_id_in_data="phys9660761",
-        )
+        return Page(page_element_in_data, xml_tree)
 
+    def test_page_instantiation(self, page):
         assert page.label == "Seite 61"
         assert page.order == "57"
         assert page.id == "9660761"
 
-        creation_date = None
-        mime_type_image_string = IMAGE_MIME_TYPE
-
-        page_thumbnail_file = page.thumbnail
+    @pytest.mark.parametrize(
+        "file_attribute_name, expected_url",
+        [
+            (
+                "thumbnail",
+                "https://sammlungen.ub.uni-frankfurt.de/biodiv/download/webcache/128/9660761",
+            ),
+            (
+                "image_default_resolution",
+                "https://sammlungen.ub.uni-frankfurt.de/biodiv/download/webcache/1000/9660761",
+            ),
+            (
+                "image_max_resolution",
+                "https://sammlungen.ub.uni-frankfurt.de/biodiv/download/webcache/0/9660761",
+            ),
+            (
+                "image_min_resolution",
+                "https://sammlungen.ub.uni-frankfurt.de/biodiv/download/webcache/504/9660761",
+            ),
+        ],
+    )
+    def test_page_files(self, page, file_attribute_name, expected_url):
         file_test(
-            page_thumbnail_file,
-            expected_url="https://sammlungen.ub.uni-frankfurt.de/biodiv/download/webcache/128/9660761",
-            expected_date=creation_date,
-            expected_mime_type=mime_type_image_string,
+            getattr(page, file_attribute_name),
+            expected_url=expected_url,
+            expected_date=None,
+            expected_mime_type=IMAGE_MIME_TYPE,
         )
 
-        page_default_res_file = page.image_default_resolution
-        file_test(
-            page_default_res_file,
-            expected_url="https://sammlungen.ub.uni-frankfurt.de/biodiv/download/webcache/1000/9660761",
-            expected_date=creation_date,
-            expected_mime_type=mime_type_image_string,
-        )
+    def test_page_files_are_created_once(self, page):
+        assert page.thumbnail is page.thumbnail
+        assert page.image_default_resolution is not page.thumbnail
 
-        page_maximum_res_file = page.image_max_resolution
-        file_test(
-            page_maximum_res_file,
-            expected_url="https://sammlungen.ub.uni-frankfurt.de/biodiv/download/webcache/0/9660761",
-            expected_date=creation_date,
-            expected_mime_type=mime_type_image_string,
-        )
+    @pytest.mark.network
+    def test_page_full_text(self, page):
+        assert page.full_text == full_text_data.phys9660761_full_text
 
-        page_minimum_res_file = page.image_min_resolution
-        file_test(
-            page_minimum_res_file,
-            expected_url="https://sammlungen.ub.uni-frankfurt.de/biodiv/download/webcache/504/9660761",
-            expected_date=creation_date,
-            expected_mime_type=mime_type_image_string,
+    def test_page_resources_are_read_only(self):
+        page = TestPage.get_new_page_with_data(
+            xml_file_name_in_data_folder="article-oai-response.xml",
+            page_id_in_data="phys9660761",
         )
 
-        full_text = full_text_data.phys9660761_full_text
-        page_text = page.full_text
-        assert full_text == page_text
+        with pytest.raises(AttributeError):
+            page.thumbnail = None
+
+        with pytest.raises(AttributeError):
+            page.full_text = ""
 
 
 def file_test(
     file: File,
     expected_url: str,
-    expected_date: Optional[datetime],
+    expected_date: Optional[date],
     expected_mime_type: str,
 ):
     assert file.url == expected_url
     if file.date_uploaded is not None:
-        assert file.date_uploaded.date() == expected_date.date()
+        assert file.date_uploaded.date() == expected_date
     assert file.mime_type == expected_mime_type
@@ -1,4 +1,4 @@
-import os
+from pathlib import Path
 
 import pytest
 
@@ -7,10 +7,13 @@ from VisualLibrary.VisualLibrary import remove_letters_from_alphanumeric_string
 
 IMAGE_MIME_TYPE = "image/jpeg"
 
-this_files_directory = os.path.dirname(os.path.realpath(__file__))
-TEST_DATA_FOLDER = f"{this_files_directory}/data/VisualLibrary"
+TEST_DATA_FOLDER = Path(__file__).resolve().parent / "data" / "VisualLibrary"
+ARTICLE_XML_FILE_PATH = TEST_DATA_FOLDER / "article-oai-response.xml"
+JOURNAL_XML_FILE_PATH = TEST_DATA_FOLDER / "journal-oai-response.xml"
+VOLUME_XML_FILE_PATH = TEST_DATA_FOLDER / "volume-oai-response.xml"
 
 
+@pytest.mark.network
 class TestVisualLibrary:
     def test_publication_year_hard_to_fetch(self, visual_library):
         issue_id = "10823380"
@@ -23,9 +26,7 @@ class TestVisualLibrary:
         https://sammlungen.ub.uni-frankfurt.de/oai/?verb=GetRecord
         &metadataPrefix=mets&identifier=10688403
         """
-        xml_test_file_path = f"{TEST_DATA_FOLDER}/journal-oai-response.xml"
-
-        vl_object = visual_library.get_element_from_xml_file(xml_test_file_path)
+        vl_object = visual_library.get_element_from_xml_file(JOURNAL_XML_FILE_PATH)
         journal_label = (
             "Decheniana: Verhandlungen des Naturhistorischen "
             "Vereins der Rheinlande und Westfalens"
@@ -54,21 +55,16 @@ class TestVisualLibrary:
         )
         assert publisher.uri == "http://d-nb.info/gnd/40094-4"
 
-        counter = 0
+        assert len(vl_object.elements) == 6
         for volume in vl_object.elements:
-            counter += 1
             assert volume.parent is vl_object
 
-        assert counter == 6
-
     def test_call_for_volume(self, visual_library):
         """Metadata from:
         https://sammlungen.ub.uni-frankfurt.de/oai/?verb=
         GetRecord&metadataPrefix=mets&identifier=10771471
         """
-        xml_test_file_path = f"{TEST_DATA_FOLDER}/volume-oai-response.xml"
-
-        vl_object = visual_library.get_element_from_xml_file(xml_test_file_path)
+        vl_object = visual_library.get_element_from_xml_file(VOLUME_XML_FILE_PATH)
         journal_label = (
             "Decheniana: Verhandlungen des Naturhistorischen Vereins der "
             "Rheinlande und Westfalens"
@@ -85,19 +81,14 @@ class TestVisualLibrary:
             == "https://sammlungen.ub.uni-frankfurt.de/biodiv/download/pdf/10771471"
         )
 
-        counter = 0
+        assert len(vl_object.articles) == 7
         for article in vl_object.articles:
-            counter += 1
             assert len(article.files) == 1
             assert article.parent is vl_object
             assert article.journal_label == journal_label
 
-        assert counter == 7
-
     def test_call_for_article(self, visual_library):
-        xml_test_file_path = f"{TEST_DATA_FOLDER}/article-oai-response.xml"
-
-        vl_object = visual_library.get_element_from_xml_file(xml_test_file_path)
+        vl_object = visual_library.get_element_from_xml_file(ARTICLE_XML_FILE_PATH)
         journal_label = (
             "Decheniana: Verhandlungen des Naturhistorischen Vereins "
             "der Rheinlande und Westfalens"
@@ -126,12 +117,18 @@ class TestVisualLibrary:
         assert vl_object.page_range.start == "283"
         assert vl_object.page_range.end == "287"
 
-        for page in vl_object.pages:
-            assert page.image_min_resolution.mime_type == IMAGE_MIME_TYPE
-            assert page.image_max_resolution.mime_type == IMAGE_MIME_TYPE
-            assert page.image_default_resolution.mime_type == IMAGE_MIME_TYPE
-            assert page.thumbnail.mime_type == IMAGE_MIME_TYPE
-            assert len(page.full_text) > 0
+        pages = vl_object.pages
+        assert {page.image_min_resolution.mime_type for page in pages} == {
+            IMAGE_MIME_TYPE
+        }
+        assert {page.image_max_resolution.mime_type for page in pages} == {
+            IMAGE_MIME_TYPE
+        }
+        assert {page.image_default_resolution.mime_type for page in pages} == {
+            IMAGE_MIME_TYPE
+        }
+        assert {page.thumbnail.mime_type for page in pages} == {IMAGE_MIME_TYPE}
+        assert all(len(page.full_text) > 0 for page in pages)
 
         assert len(vl_object.full_text) == 8017
 
@@ -362,7 +359,16 @@ class TestVisualLibrary:
         assert isinstance(instance, VisualLibraryExportElement)
 
 
-def test_remove_letters_from_alphanumeric_string():
-    assert remove_letters_from_alphanumeric_string("1071953)") == "1071953"
-    assert remove_letters_from_alphanumeric_string("107 (1953)") == "1071953"
-    assert remove_letters_from_alphanumeric_string("1. Lieferung") == "1"
+@pytest.mark.parametrize(
+    "alphanumeric_string,expected_string",
+    [
+        ("1071953)", "1071953"),
+        ("107 (1953)", "1071953"),
+        ("1. Lieferung", "1"),
+        ("a1b2c3d4e5f6g7h8i9j", "123456789"),
+    ],
+)
+def test_remove_letters_from_alphanumeric_string(alphanumeric_string, expected_string):
+    assert (
+        remove_letters_from_alphanumeric_string(alphanumeric_string) == expected_string
+    )